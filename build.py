@@ -19,33 +19,173 @@ Examples:
 
 from __future__ import annotations
 
+import argparse
+import atexit
+import hashlib
+import os
+import re
+import shlex
 import shutil
+import stat
 import subprocess
 import sys
+import tempfile
+import threading
+import traceback
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
 from enum import Enum
+from functools import cache, lru_cache, partial, wraps
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import IO, TYPE_CHECKING, Annotated, Any, Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-# Initialize Rich console for beautiful output
-console = Console()
+# Rich is imported on first use rather than at module load, so startup and
+# --help stay fast
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+
+
+# Set by minimal_main: print plain text and never import Rich
+_plain_output = False
+
+
+class _PlainConsole:
+    """Console replacement for plain-text mode that strips Rich markup."""
+
+    _MARKUP = re.compile(r"\[/?[a-z][a-z .]*\]")
+
+    def print(
+        self,
+        *objects: Any,
+        style: str | None = None,  # noqa: ARG002 - accepted for Rich compatibility
+        markup: bool = True,
+        highlight: bool | None = None,  # noqa: ARG002 - accepted for Rich compatibility
+        end: str = "\n",
+    ) -> None:
+        text = " ".join(str(obj) for obj in objects)
+        if markup:
+            text = self._MARKUP.sub("", text)
+        print(text, end=end, flush=True)
+
+    def print_exception(self) -> None:
+        traceback.print_exc()
+
+
+class _PlainProgress:
+    """Progress replacement for plain-text mode that prints each new task."""
+
+    def __enter__(self) -> _PlainProgress:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def add_task(
+        self,
+        description: str,
+        total: float | None = None,  # noqa: ARG002 - accepted for Rich compatibility
+    ) -> int:
+        console.print(description)
+        return 0
+
+    def update(self, task_id: int, **fields: Any) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+@cache
+def get_console() -> Console:
+    """Create the shared Rich console on first use."""
+    if _plain_output:
+        return _PlainConsole()  # type: ignore[return-value]
+
+    from rich.console import Console
+
+    return Console()
+
+
+class _LazyConsole:
+    """Stand-in for the Rich console that creates it on first attribute access."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_console(), name)
+
+
+# Rich console for beautiful output
+console = _LazyConsole()
 app = typer.Typer(
     name="build",
     help="Build system for Tauri MCP Server project",
     add_completion=False,
 )
 
-# Project paths
-PROJECT_ROOT = Path(__file__).parent.absolute()
-MCP_SERVER_DIR = PROJECT_ROOT / "mcp-server-ts"
-DIST_JS_DIR = PROJECT_ROOT / "dist-js"
-TARGET_DIR = PROJECT_ROOT / "target"
-MCP_BUILD_DIR = MCP_SERVER_DIR / "build"
+
+# Project paths are resolved on first use so that --help never touches the
+# filesystem
+@cache
+def project_root() -> Path:
+    """Directory containing this script."""
+    return Path(__file__).parent.absolute()
+
+
+@cache
+def mcp_server_dir() -> Path:
+    """TypeScript MCP server package."""
+    return project_root() / "mcp-server-ts"
+
+
+@cache
+def dist_js_dir() -> Path:
+    """Output of the plugin's JavaScript bindings build."""
+    return project_root() / "dist-js"
+
+
+@cache
+def target_dir() -> Path:
+    """Cargo build output."""
+    return project_root() / "target"
+
+
+@cache
+def mcp_build_dir() -> Path:
+    """Output of the MCP server build."""
+    return mcp_server_dir() / "build"
+
+
+@cache
+def js_transpiler_cache_dir() -> Path:
+    """Bun's runtime transpiler cache, shared by both JS builds."""
+    return project_root() / "node_modules" / ".cache" / "bun"
+
+
+@cache
+def build_cache_dir() -> Path:
+    """
+    Source hashes of the last successful builds.
+
+    Kept inside target/ so that cleaning the build output (or `cargo clean`)
+    also invalidates them.
+    """
+    return target_dir() / ".build-cache"
+
+
+# Processes started by run_command that are still running, so a failing build
+# can stop its siblings when builds run concurrently
+_active_processes: set[subprocess.Popen] = set()
+_terminated_processes: set[subprocess.Popen] = set()
+_processes_lock = threading.Lock()
+
+# Directories being deleted in the background by clean_directory
+_pending_deletions: list[threading.Thread] = []
+
+# Read size for streaming verbose command output
+STREAM_CHUNK_SIZE = 65536
 
 
 class BuildTarget(str, Enum):
@@ -62,53 +202,137 @@ class BuildError(Exception):
     pass
 
 
-def check_command_exists(command: str) -> bool:
+class BuildCancelled(BuildError):
+    """A command was stopped because a concurrent build failed."""
+
+    pass
+
+
+@cache
+def find_command(command: str) -> str | None:
     """
-    Check if a command exists in the system PATH.
+    Resolve a command to its absolute path in the system PATH.
+
+    The result is cached for the lifetime of the process, so repeated lookups
+    for the same tool only scan PATH once.
 
     Args:
-        command: Command name to check
+        command: Command name to look up
 
     Returns:
-        True if command exists, False otherwise
+        Absolute path to the executable, or None if not found
     """
-    return shutil.which(command) is not None
+    return shutil.which(command)
 
 
-def validate_tools(targets: list[BuildTarget]) -> None:
+def validate_tools(targets: Iterable[BuildTarget]) -> dict[str, str]:
     """
     Validate that required build tools are installed.
 
+    Successful validations are cached per set of targets, so validating the
+    same targets again is free.
+
     Args:
-        targets: List of build targets to validate tools for
+        targets: Build targets to validate tools for
+
+    Returns:
+        Mapping of tool names to resolved executable paths. The JavaScript
+        package manager (bun, or npm as a fallback) is stored under "js_pm".
 
     Raises:
         BuildError: If required tools are missing
     """
+    return _validate_tools(frozenset(targets))
+
+
+@lru_cache(maxsize=8)
+def _validate_tools(targets: frozenset[BuildTarget]) -> dict[str, str]:
+    """Validate tools for a hashable set of targets (see validate_tools)."""
     required_tools: dict[str, list[BuildTarget]] = {
         "cargo": [BuildTarget.PLUGIN, BuildTarget.ALL],
         "rustc": [BuildTarget.PLUGIN, BuildTarget.ALL],
-        "bun": [BuildTarget.MCP, BuildTarget.ALL],
     }
 
+    resolved_tools: dict[str, str] = {}
     missing_tools: list[str] = []
 
     for tool, tool_targets in required_tools.items():
         if any(target in tool_targets for target in targets):
-            if not check_command_exists(tool):
+            path = find_command(tool)
+            if path is None:
                 missing_tools.append(tool)
+            else:
+                resolved_tools[tool] = path
+
+    # Every target runs a JS build: the plugin for its bindings, the MCP
+    # server for the TypeScript compile
+    js_pm = find_command("bun") or find_command("npm")
+    if js_pm is None:
+        missing_tools.append("bun (or npm)")
+    else:
+        resolved_tools["js_pm"] = js_pm
 
     if missing_tools:
-        console.print(
-            Panel(
-                f"[red]Missing required tools:[/red]\n"
-                + "\n".join(f"  • {tool}" for tool in missing_tools),
-                title="Build Prerequisites Failed",
-                border_style="red",
-            )
+        print_panel(
+            f"[red]Missing required tools:[/red]\n"
+            + "\n".join(f"  • {tool}" for tool in missing_tools),
+            border_style="red",
+            title="Build Prerequisites Failed",
         )
         raise BuildError(f"Missing required tools: {', '.join(missing_tools)}")
 
+    return resolved_tools
+
+
+def start_command(
+    command: list[str],
+    cwd: Path | None = None,
+    env: dict[str, str] | None = None,
+    stdout: int | IO[bytes] = subprocess.PIPE,
+) -> subprocess.Popen:
+    """
+    Start a command without waiting for it to finish.
+
+    stderr is merged into stdout and stdin is closed, since build commands are
+    never interactive. The process is tracked until run_command reaps it, so
+    that terminate_active_commands can stop it if a concurrent build fails.
+
+    Args:
+        command: Command and arguments to run
+        cwd: Working directory for command execution
+        env: Optional environment variables
+        stdout: Where to send output (an unbuffered binary pipe by default)
+
+    Returns:
+        Popen handle
+
+    Raises:
+        FileNotFoundError: If the executable does not exist
+    """
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=stdout,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+        env=env,
+    )
+    with _processes_lock:
+        _active_processes.add(process)
+    return process
+
+
+def terminate_active_commands() -> None:
+    """Terminate every command started by start_command that is still running."""
+    with _processes_lock:
+        processes = list(_active_processes)
+        _terminated_processes.update(processes)
+
+    for process in processes:
+        if process.poll() is None:
+            process.terminate()
+
 
 def run_command(
     command: list[str],
@@ -131,77 +355,571 @@ def run_command(
     Raises:
         BuildError: If command fails
     """
-    cmd_str = " ".join(command)
-
     if verbose:
-        console.print(f"[dim]Running: {cmd_str}[/dim]")
+        console.print(f"[dim]Running: {shlex.join(command)}[/dim]")
 
-    try:
-        if verbose:
-            # Stream output in real-time
-            process = subprocess.Popen(
+    # In quiet mode output goes to an anonymous temp file instead of being
+    # buffered in memory; it is only read back if the command fails
+    with tempfile.TemporaryFile() if not verbose else nullcontext() as output_file:
+        try:
+            process = start_command(
                 command,
                 cwd=cwd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
                 env=env,
+                stdout=subprocess.PIPE if output_file is None else output_file,
             )
+        except FileNotFoundError as e:
+            raise BuildError(f"Command not found: {command[0]}") from e
+
+        try:
+            if verbose:
+                # Stream output in real-time
+                if process.stdout:
+                    stream_output(process.stdout.fileno())
+
+                return_code = process.wait()
+
+                if return_code != 0:
+                    if process in _terminated_processes:
+                        raise BuildCancelled(f"Command cancelled: {shlex.join(command)}")
+                    raise BuildError(f"Command failed with exit code {return_code}")
+
+            else:
+                return_code = process.wait()
+
+                if return_code != 0:
+                    if process in _terminated_processes:
+                        raise BuildCancelled(f"Command cancelled: {shlex.join(command)}")
+                    assert output_file is not None
+                    output_file.seek(0)
+                    raise subprocess.CalledProcessError(
+                        return_code,
+                        command,
+                        output=output_file.read().decode(errors="replace"),
+                    )
+
+            return subprocess.CompletedProcess(args=command, returncode=return_code)
+
+        except subprocess.CalledProcessError as e:
+            cmd_str = shlex.join(command)
+            console.print(f"[red]Command failed:[/red] {cmd_str}")
+            if e.output:
+                console.print("[red]OUTPUT:[/red]")
+                console.print(e.output)
+            raise BuildError(f"Command failed: {cmd_str}") from e
+        finally:
+            with _processes_lock:
+                _active_processes.discard(process)
+                _terminated_processes.discard(process)
+
+
+def stream_output(fd: int) -> None:
+    """
+    Echo command output from a pipe to the console until it is closed.
 
-            if process.stdout:
-                for line in process.stdout:
-                    console.print(f"  {line.rstrip()}", style="dim")
+    Reads large raw chunks instead of iterating line by line through a text
+    wrapper, so long builds cost far fewer reads and decoder calls. A blocking
+    os.read returns as soon as any output is available, so output still
+    appears in real time.
 
-            return_code = process.wait()
+    All complete lines of a chunk are decoded together and rendered with a
+    single console.print, with markup and highlighting off since the output
+    is plain tool text.
 
-            if return_code != 0:
-                raise BuildError(f"Command failed with exit code {return_code}")
+    Args:
+        fd: File descriptor of the read end of the pipe
+    """
+    pending = b""
 
-            return subprocess.CompletedProcess(
-                args=command,
-                returncode=return_code,
-                stdout="",
-                stderr="",
-            )
-        else:
-            # Capture output silently
-            result = subprocess.run(
-                command,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                check=True,
-                env=env,
-            )
-            return result
+    while chunk := os.read(fd, STREAM_CHUNK_SIZE):
+        # Only complete lines are printed; a trailing partial line waits for
+        # the next chunk
+        complete, newline, pending = (pending + chunk).rpartition(b"\n")
+        if newline:
+            _print_output(complete)
+
+    if pending:
+        _print_output(pending)
+
+
+def _print_output(output: bytes) -> None:
+    """Decode and render a block of command output lines, indented and dimmed."""
+    text = output.decode(errors="replace")
+    console.print(
+        "\n".join(f"  {line.rstrip()}" for line in text.split("\n")),
+        style="dim",
+        markup=False,
+        highlight=False,
+    )
+
+
+def run_concurrently(jobs: list[Callable[[], None]]) -> None:
+    """
+    Run build jobs in parallel threads.
+
+    As soon as one job fails, the commands of the remaining jobs are
+    terminated. Waits for every job to finish before returning.
+
+    Args:
+        jobs: Callables to run, each typically a build function
+
+    Raises:
+        Exception: The error of the first job that failed on its own, rather
+            than one cancelled because of it
+    """
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = [executor.submit(job) for job in jobs]
+
+        try:
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        except KeyboardInterrupt:
+            terminate_active_commands()
+            raise
+
+        if any(future.exception() is not None for future in done):
+            terminate_active_commands()
+
+    # Every job has finished now; a sibling's cancellation may have been
+    # recorded before the failure that caused it
+    errors = [error for future in futures if (error := future.exception()) is not None]
+    if errors:
+        raise next(
+            (error for error in errors if not isinstance(error, BuildCancelled)),
+            errors[0],
+        )
+
+
+def print_panel(message: str, border_style: str, title: str | None = None) -> None:
+    """
+    Print a message in a bordered Rich panel, or as plain text.
+
+    Args:
+        message: Panel content (Rich markup)
+        border_style: Style of the panel border
+        title: Optional panel title
+    """
+    if _plain_output:
+        if title:
+            console.print(title)
+        console.print(message)
+        return
+
+    from rich.panel import Panel
+
+    console.print(Panel(message, title=title, border_style=border_style))
+
+
+def create_progress() -> Progress:
+    """Create the spinner progress display used by all build steps."""
+    if _plain_output:
+        return _PlainProgress()  # type: ignore[return-value]
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=get_console(),
+    )
+
+
+@contextmanager
+def use_progress(progress: Progress | None) -> Iterator[Progress]:
+    """
+    Yield a shared progress display, or a fresh one if none is given.
+
+    Rich only allows one live display at a time, so concurrent builds must
+    add their tasks to a single shared Progress.
+
+    Args:
+        progress: Shared progress display, if any
+
+    Yields:
+        Progress instance to add tasks to
+    """
+    if progress is not None:
+        yield progress
+        return
 
-    except subprocess.CalledProcessError as e:
-        console.print(f"[red]Command failed:[/red] {cmd_str}")
-        if e.stdout:
-            console.print("[red]STDOUT:[/red]")
-            console.print(e.stdout)
-        if e.stderr:
-            console.print("[red]STDERR:[/red]")
-            console.print(e.stderr)
-        raise BuildError(f"Command failed: {cmd_str}") from e
-    except FileNotFoundError as e:
-        raise BuildError(f"Command not found: {command[0]}") from e
+    with create_progress() as new_progress:
+        yield new_progress
+
+
+def remove_tree(path: Path, ignore_errors: bool = False) -> None:
+    """
+    Delete a directory tree.
+
+    On Linux and macOS this runs `rm -rf`, which unlinks entries without
+    Python-level overhead per file; elsewhere it falls back to shutil.rmtree.
+
+    Args:
+        path: Directory to delete
+        ignore_errors: If True, ignore failures to delete entries
+
+    Raises:
+        OSError: If deletion fails and ignore_errors is False
+    """
+    rm = find_command("rm") if sys.platform in ("linux", "darwin") else None
+
+    if rm is None:
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+        return
+
+    result = subprocess.run(
+        [rm, "-rf", "--", str(path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL if ignore_errors else None,
+    )
+    if result.returncode != 0 and not ignore_errors:
+        raise OSError(f"Could not remove {path}")
 
 
 def clean_directory(directory: Path, verbose: bool = False) -> None:
     """
     Remove a directory and all its contents.
 
+    The directory is first renamed out of the way, which is atomic and
+    instant, and the renamed tree is deleted in a background thread. The
+    build can therefore recreate the directory immediately instead of
+    waiting for a large tree such as target/ to be unlinked.
+
     Args:
         directory: Directory path to remove
         verbose: If True, show what's being cleaned
     """
-    if directory.exists():
-        if verbose:
-            console.print(f"[yellow]Cleaning:[/yellow] {directory}")
-        shutil.rmtree(directory)
-        if verbose:
-            console.print(f"[green]Cleaned:[/green] {directory}")
+    # A single lstat both checks for the entry and tells symlinks apart
+    try:
+        is_link = stat.S_ISLNK(os.lstat(directory).st_mode)
+    except FileNotFoundError:
+        return
+
+    if is_link:
+        # Keep the user's link (e.g. target/ on another disk) and clear the
+        # directory it points to instead
+        real_directory = directory.resolve()
+        if not real_directory.is_dir():
+            return
+    else:
+        real_directory = directory
+
+    if verbose:
+        console.print(f"[yellow]Cleaning:[/yellow] {directory}")
+
+    doomed = real_directory.with_name(f"{real_directory.name}.delete-{os.getpid()}")
+    try:
+        os.rename(real_directory, doomed)
+    except OSError:
+        # Rename can fail e.g. on Windows when a file is in use
+        remove_tree(real_directory)
+    else:
+        thread = threading.Thread(
+            target=remove_tree,
+            args=(doomed,),
+            kwargs={"ignore_errors": True},
+            daemon=True,
+        )
+        thread.start()
+        _pending_deletions.append(thread)
+
+    if is_link:
+        # The link must not dangle once its target has been moved away
+        real_directory.mkdir(exist_ok=True)
+
+    if verbose:
+        console.print(f"[green]Cleaned:[/green] {directory}")
+
+
+@atexit.register
+def _wait_for_pending_deletions() -> None:
+    """Let background deletions finish so no renamed directories are left behind."""
+    for thread in _pending_deletions:
+        thread.join()
+
+
+def _cgroup_cpu_limit() -> int | None:
+    """
+    Read the CPU quota of this process's cgroup, if it has one.
+
+    Checks the cgroup v2 `cpu.max` file of the current cgroup, then the
+    cgroup v1 CFS quota.
+
+    Returns:
+        Quota rounded up to whole CPUs, or None when unlimited or unknown
+    """
+    candidates: list[tuple[Path, Path | None]] = []
+    try:
+        for line in Path("/proc/self/cgroup").read_text().splitlines():
+            if line.startswith("0::"):
+                group = Path("/sys/fs/cgroup") / line[3:].lstrip("/")
+                candidates.append((group / "cpu.max", None))
+    except OSError:
+        pass
+    candidates.append((Path("/sys/fs/cgroup/cpu.max"), None))
+    candidates.append(
+        (
+            Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us"),
+            Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us"),
+        )
+    )
+
+    for quota_file, period_file in candidates:
+        try:
+            fields = quota_file.read_text().split()
+            if period_file is not None:
+                fields.append(period_file.read_text().strip())
+            quota, period = fields[0], int(fields[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        # "max" (v2) and -1 (v1) both mean no quota
+        if quota == "max" or int(quota) <= 0 or period <= 0:
+            return None
+        return max(1, -(-int(quota) // period))
+
+    return None
+
+
+def available_cpus() -> int:
+    """
+    Count the CPUs this process can actually use.
+
+    Takes the scheduler affinity mask where available, which honours cpusets,
+    and lowers it to the cgroup CPU quota, which is how container runtimes
+    usually limit CPU (`docker run --cpus`).
+
+    Returns:
+        Number of usable CPUs (at least 1)
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is not available on macOS and Windows
+        cpus = os.cpu_count() or 1
+
+    limit = _cgroup_cpu_limit()
+    return min(cpus, limit) if limit else cpus
+
+
+def js_build_env(js_pm: str) -> dict[str, str] | None:
+    """
+    Build the environment for a JS package manager build.
+
+    When building with bun, points its runtime transpiler cache at a
+    project-local directory unless the user already configured one.
+
+    Args:
+        js_pm: Path to the JS package manager
+
+    Returns:
+        Environment for the build, or None to inherit the current one
+    """
+    if Path(js_pm).stem != "bun" or "BUN_RUNTIME_TRANSPILER_CACHE_PATH" in os.environ:
+        return None
+
+    return {
+        **os.environ,
+        "BUN_RUNTIME_TRANSPILER_CACHE_PATH": str(js_transpiler_cache_dir()),
+    }
+
+
+# Environment variables that change what cargo produces
+RUST_BUILD_ENV_VARS = (
+    "RUSTC",
+    "RUSTC_WRAPPER",
+    "RUSTFLAGS",
+    "RUSTDOCFLAGS",
+    "CARGO_ENCODED_RUSTFLAGS",
+    "CARGO_BUILD_RUSTFLAGS",
+    "CARGO_TARGET_DIR",
+)
+
+
+@cache
+def rustc_version() -> str:
+    """
+    Get the verbose version of the rustc that cargo will use here.
+
+    Run from the project root so rustup honours any toolchain override.
+
+    Returns:
+        Output of `rustc -vV`, or an empty string if it cannot be run
+    """
+    rustc = find_command("rustc")
+    if rustc is None:
+        return ""
+    try:
+        result = subprocess.run(
+            [rustc, "-vV"],
+            cwd=project_root(),
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+        )
+    except OSError:
+        return ""
+    return result.stdout if result.returncode == 0 else ""
+
+
+def rust_build_config(command: list[str]) -> str:
+    """
+    Describe everything besides the sources that determines cargo's output.
+
+    Args:
+        command: The cargo command line (the -j job count is ignored)
+
+    Returns:
+        Toolchain version, cargo arguments and relevant environment variables
+    """
+    args = [arg for i, arg in enumerate(command) if arg != "-j" and command[i - 1] != "-j"]
+    env = [
+        f"{name}={value}"
+        for name, value in sorted(os.environ.items())
+        if name in RUST_BUILD_ENV_VARS or name.startswith("CARGO_PROFILE_")
+    ]
+    return "\0".join([rustc_version(), shlex.join(args), *env])
+
+
+@cache
+def plugin_crate_name() -> str:
+    """Library name of the plugin crate, as used in its build artifacts."""
+    match = re.search(
+        r'^name\s*=\s*"([^"]+)"',
+        (project_root() / "Cargo.toml").read_text(encoding="utf-8"),
+        re.MULTILINE,
+    )
+    return match.group(1).replace("-", "_") if match else ""
+
+
+def plugin_artifact(release: bool, target: str | None) -> Path:
+    """
+    Path of the library cargo builds for the plugin.
+
+    Args:
+        release: Whether this is a release build
+        target: Optional Rust target triple
+
+    Returns:
+        Path to the plugin's .rlib in the target directory
+    """
+    profile_dir = target_dir() / target if target else target_dir()
+    profile_dir /= "release" if release else "debug"
+    return profile_dir / f"lib{plugin_crate_name()}.rlib"
+
+
+def plugin_source_digest(build_config: str = "") -> str:
+    """
+    Hash every input of the Rust build.
+
+    Covers the Rust sources, build script, Cargo manifests and hand-written
+    permission files; permissions/autogenerated is excluded because the build
+    script rewrites it.
+
+    Args:
+        build_config: Toolchain and flags description (see rust_build_config)
+
+    Returns:
+        Hex digest of the build configuration, file paths and contents
+    """
+    files = [
+        *(project_root() / "src").rglob("*.rs"),
+        *(
+            path
+            for path in (project_root() / "permissions").rglob("*.toml")
+            if "autogenerated" not in path.parts
+        ),
+        project_root() / "build.rs",
+        project_root() / "Cargo.toml",
+        project_root() / "Cargo.lock",
+    ]
+
+    digest = hashlib.blake2b(build_config.encode() + b"\0")
+    for path in sorted(files):
+        if not path.is_file():
+            continue
+        digest.update(path.relative_to(project_root()).as_posix().encode() + b"\0")
+        with open(path, "rb") as f:
+            digest.update(hashlib.file_digest(f, "blake2b").digest())
+
+    return digest.hexdigest()
+
+
+def _latest_mtime_ns(root: str, suffix: str) -> int:
+    """
+    Find the newest modification time below a directory.
+
+    Considers files ending in suffix and the directories themselves, so that
+    deleting or renaming a source file also counts as a change. Uses
+    os.scandir, whose entries carry their type and avoid extra stat calls.
+
+    Args:
+        root: Directory to scan recursively
+        suffix: File name suffix of the files to consider
+
+    Returns:
+        Newest mtime in nanoseconds
+    """
+    latest = os.stat(root).st_mtime_ns
+
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                latest = max(latest, _latest_mtime_ns(entry.path, suffix))
+            elif entry.name.endswith(suffix):
+                latest = max(latest, entry.stat().st_mtime_ns)
+
+    return latest
+
+
+def _needs_rebuild(
+    src_root: Path, stamp_file: Path, build_root: Path, inputs: Iterable[Path] = ()
+) -> bool:
+    """
+    Decide whether a build is stale by comparing modification times.
+
+    The stamp file is only written after a successful build, so its mtime
+    records when the build last completed. The output directory itself is no
+    marker: tsc writes it even when the build fails.
+
+    Args:
+        src_root: Directory of .ts sources
+        stamp_file: File written after each successful build
+        build_root: Build output directory
+        inputs: Additional input files, such as package.json
+
+    Returns:
+        True unless the last successful build is newer than every source and
+        input and its output is still there
+    """
+    if not build_root.is_dir():
+        return True
+
+    try:
+        build_mtime = stamp_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return True
+
+    latest_source = _latest_mtime_ns(str(src_root), ".ts")
+    for path in inputs:
+        try:
+            latest_source = max(latest_source, path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            continue
+
+    return build_mtime <= latest_source
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """
+    Write a text file so readers never see partial content.
+
+    Args:
+        path: File to write, parent directories are created as needed
+        content: Text to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
 
 
 def build_plugin(
@@ -209,6 +927,9 @@ def build_plugin(
     verbose: bool = False,
     release: bool = True,
     target: str | None = None,
+    js_pm: str | None = None,
+    progress: Progress | None = None,
+    exec_js_build: bool = False,
 ) -> None:
     """
     Build the Rust Tauri plugin.
@@ -218,29 +939,30 @@ def build_plugin(
         verbose: Show detailed build output
         release: Build in release mode
         target: Optional Rust target triple
+        js_pm: Path to the JS package manager (resolved if not given)
+        progress: Shared progress display, when building concurrently
+        exec_js_build: When the Rust build is up to date, replace the current
+            process with the JS build (POSIX only). The function then never
+            returns and the exit status is the JS build's, so only use this
+            when nothing follows it.
     """
+    if js_pm is None:
+        js_pm = validate_tools([BuildTarget.PLUGIN])["js_pm"]
+
     console.print("\n[bold cyan]Building Tauri Plugin (Rust)[/bold cyan]\n")
 
-    # Clean if requested
-    if clean:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+    # One progress display for all phases, with a task per phase
+    with use_progress(progress) as progress:
+        # Clean if requested
+        if clean:
             task = progress.add_task("Cleaning plugin artifacts...", total=None)
-            clean_directory(TARGET_DIR, verbose)
-            clean_directory(DIST_JS_DIR, verbose)
-            progress.update(task, completed=True)
+            clean_directory(target_dir(), verbose)
+            clean_directory(dist_js_dir(), verbose)
+            progress.update(task, total=1, completed=1)
             console.print("[green]✓[/green] Plugin artifacts cleaned\n")
 
-    # Build Rust plugin
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Building Rust plugin...", total=None)
+        # Build Rust plugin
+        rust_task = progress.add_task("Building Rust plugin...", total=None)
 
         command = ["cargo", "build"]
 
@@ -250,87 +972,125 @@ def build_plugin(
         if target:
             command.extend(["--target", target])
 
-        if verbose:
-            console.print(f"[dim]Command: {' '.join(command)}[/dim]\n")
-
-        run_command(command, cwd=PROJECT_ROOT, verbose=verbose)
+        # Only cap the jobs when this process is limited to fewer CPUs than
+        # the host has, so build.jobs in .cargo/config.toml or an explicit
+        # CARGO_BUILD_JOBS still applies everywhere else
+        jobs = available_cpus()
+        if "CARGO_BUILD_JOBS" not in os.environ and jobs < (os.cpu_count() or jobs):
+            command.extend(["-j", str(jobs)])
+
+        # Skip cargo entirely when no input, toolchain or flag changed since
+        # the last successful build with the same profile and target, and the
+        # library it produced is still there (cargo clean -p/--release)
+        profile = "release" if release else "debug"
+        hash_file = build_cache_dir() / f"plugin-{profile}-{target or 'host'}.hash"
+        source_digest = plugin_source_digest(rust_build_config(command))
+
+        try:
+            previous_digest = hash_file.read_text(encoding="utf-8")
+        except OSError:
+            previous_digest = None
+
+        js_command = [js_pm, "run", "build"]
+
+        def build_js_bindings() -> None:
+            task = progress.add_task("Building JavaScript bindings...", total=None)
+            run_command(
+                js_command,
+                cwd=project_root(),
+                verbose=verbose,
+                env=js_build_env(js_pm),
+            )
+            progress.update(task, total=1, completed=1)
+
+        if previous_digest == source_digest and plugin_artifact(release, target).exists():
+            console.print("[green]✓[/green] Rust plugin up to date, skipping cargo build")
+            progress.update(rust_task, total=1, completed=1)
+
+            if exec_js_build:
+                # The JS bindings are all that is left, so replace this
+                # process with that build instead of keeping Python alive
+                # just to wait for it
+                progress.stop()
+                console.print("Building JavaScript bindings...")
+                sys.stdout.flush()
+                os.chdir(project_root())
+                os.execve(js_pm, js_command, js_build_env(js_pm) or os.environ)
+
+            build_js_bindings()
+        else:
 
-        progress.update(task, completed=True)
+            def build_rust() -> None:
+                if verbose:
+                    console.print(f"[dim]Command: {shlex.join(command)}[/dim]\n")
 
-    # Build JavaScript bindings
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Building JavaScript bindings...", total=None)
-
-        # Check which package manager to use
-        if check_command_exists("bun"):
-            run_command(["bun", "run", "build"], cwd=PROJECT_ROOT, verbose=verbose)
-        elif check_command_exists("npm"):
-            run_command(["npm", "run", "build"], cwd=PROJECT_ROOT, verbose=verbose)
-        else:
-            raise BuildError("Neither bun nor npm found for building JS bindings")
+                run_command(command, cwd=project_root(), verbose=verbose)
+                write_atomic(hash_file, source_digest)
+                progress.update(rust_task, total=1, completed=1)
 
-        progress.update(task, completed=True)
+            # The JS bindings are bundled from guest-js/ by rollup and never
+            # read cargo's output, so both builds run at the same time
+            run_concurrently([build_rust, build_js_bindings])
 
     console.print("[green]✓[/green] Plugin build complete\n")
 
 
-def build_mcp(clean: bool = False, verbose: bool = False) -> None:
+def build_mcp(
+    clean: bool = False,
+    verbose: bool = False,
+    js_pm: str | None = None,
+    progress: Progress | None = None,
+) -> None:
     """
     Build the TypeScript MCP server.
 
     Args:
         clean: Clean build artifacts before building
         verbose: Show detailed build output
+        js_pm: Path to the JS package manager (resolved if not given)
+        progress: Shared progress display, when building concurrently
     """
+    if js_pm is None:
+        js_pm = validate_tools([BuildTarget.MCP])["js_pm"]
+
     console.print("\n[bold cyan]Building MCP Server (TypeScript)[/bold cyan]\n")
 
     # Validate MCP server directory exists
-    if not MCP_SERVER_DIR.exists():
-        raise BuildError(
-            f"MCP server directory not found: {MCP_SERVER_DIR}"
-        )
+    if not mcp_server_dir().exists():
+        raise BuildError(f"MCP server directory not found: {mcp_server_dir()}")
 
-    # Clean if requested
-    if clean:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+    # One progress display for all phases, with a task per phase
+    with use_progress(progress) as progress:
+        # Clean if requested
+        if clean:
             task = progress.add_task("Cleaning MCP artifacts...", total=None)
-            clean_directory(MCP_BUILD_DIR, verbose)
-            progress.update(task, completed=True)
+            clean_directory(mcp_build_dir(), verbose)
+            progress.update(task, total=1, completed=1)
             console.print("[green]✓[/green] MCP artifacts cleaned\n")
 
-    # Build TypeScript
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+        # Build TypeScript
         task = progress.add_task("Compiling TypeScript...", total=None)
 
-        # Check which package manager to use
-        if check_command_exists("bun"):
-            run_command(
-                ["bun", "run", "build"],
-                cwd=MCP_SERVER_DIR,
-                verbose=verbose,
-            )
-        elif check_command_exists("npm"):
+        mcp_inputs = [
+            mcp_server_dir() / name for name in ("package.json", "tsconfig.json", "bun.lock")
+        ]
+        stamp_file = build_cache_dir() / "mcp.stamp"
+        if not _needs_rebuild(
+            mcp_server_dir() / "src", stamp_file, mcp_build_dir(), mcp_inputs
+        ):
+            console.print("[green]✓[/green] MCP server up to date, skipping TypeScript build")
+        else:
+            # Drop the stamp first so a failed build is never taken as current
+            stamp_file.unlink(missing_ok=True)
             run_command(
-                ["npm", "run", "build"],
-                cwd=MCP_SERVER_DIR,
+                [js_pm, "run", "build"],
+                cwd=mcp_server_dir(),
                 verbose=verbose,
+                env=js_build_env(js_pm),
             )
-        else:
-            raise BuildError("Neither bun nor npm found for building MCP server")
+            write_atomic(stamp_file, "")
 
-        progress.update(task, completed=True)
+        progress.update(task, total=1, completed=1)
 
     console.print("[green]✓[/green] MCP server build complete\n")
 
@@ -352,23 +1112,87 @@ def show_build_summary(
         release: Whether release mode is enabled
         target: Target triple if specified
     """
+    rows = [
+        ("Targets", ", ".join(t.value for t in targets)),
+        ("Clean", "Yes" if clean else "No"),
+        ("Verbose", "Yes" if verbose else "No"),
+        ("Release Mode", "Yes" if release else "No"),
+    ]
+
+    if target:
+        rows.append(("Rust Target", target))
+
+    if _plain_output:
+        console.print("Build Configuration")
+        for setting, value in rows:
+            console.print(f"  {setting}: {value}")
+        console.print()
+        return
+
+    from rich.table import Table
+
     table = Table(title="Build Configuration", show_header=False, box=None)
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
 
-    table.add_row("Targets", ", ".join(t.value for t in targets))
-    table.add_row("Clean", "Yes" if clean else "No")
-    table.add_row("Verbose", "Yes" if verbose else "No")
-    table.add_row("Release Mode", "Yes" if release else "No")
-
-    if target:
-        table.add_row("Rust Target", target)
+    for setting, value in rows:
+        table.add_row(setting, value)
 
     console.print(table)
     console.print()
 
 
+def _build_command(
+    title: str, success_message: str
+) -> Callable[[Callable[..., None]], Callable[..., None]]:
+    """
+    Wrap a Typer command with the standard banner and error handling.
+
+    Shows the title panel, runs the command, then reports success or the
+    failure and exits with the matching status code.
+
+    Args:
+        title: Title shown before the build starts
+        success_message: Message shown when the command completes
+
+    Returns:
+        Decorator for a command function
+    """
+
+    def decorator(func: Callable[..., None]) -> Callable[..., None]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> None:
+            try:
+                print_panel(f"[bold]{title}[/bold]", border_style="cyan")
+                func(*args, **kwargs)
+                print_panel(
+                    f"[bold green]{success_message}[/bold green]",
+                    border_style="green",
+                )
+                sys.exit(0)
+
+            except BuildError as e:
+                print_panel(f"[bold red]Build failed:[/bold red]\n{e}", border_style="red")
+                sys.exit(1)
+            except KeyboardInterrupt:
+                console.print("\n[yellow]Build interrupted by user[/yellow]")
+                sys.exit(130)
+            except Exception as e:
+                print_panel(
+                    f"[bold red]Unexpected error:[/bold red]\n{e}",
+                    border_style="red",
+                )
+                if kwargs.get("verbose"):
+                    console.print_exception()
+                sys.exit(1)
+
+        return wrapper
+
+    return decorator
+
+
 @app.command()
+@_build_command("Tauri MCP Server - Plugin Build", "Plugin build successful! ✓")
 def plugin(
     clean: Annotated[
         bool,
@@ -386,52 +1210,32 @@ def plugin(
         Optional[str],
         typer.Option("--target", "-t", help="Rust target triple (e.g., x86_64-unknown-linux-gnu)"),
     ] = None,
+    exec_js: Annotated[
+        bool,
+        typer.Option(
+            "--exec-js",
+            help="When Rust is up to date, hand the process over to the JS build (POSIX only)",
+        ),
+    ] = False,
 ) -> None:
     """Build the Rust Tauri plugin."""
-    try:
-        console.print(
-            Panel(
-                "[bold]Tauri MCP Server - Plugin Build[/bold]",
-                border_style="cyan",
-            )
-        )
-
-        show_build_summary([BuildTarget.PLUGIN], clean, verbose, release, target)
-        validate_tools([BuildTarget.PLUGIN])
-        build_plugin(clean=clean, verbose=verbose, release=release, target=target)
-
-        console.print(
-            Panel(
-                "[bold green]Plugin build successful! ✓[/bold green]",
-                border_style="green",
-            )
-        )
-        sys.exit(0)
-
-    except BuildError as e:
-        console.print(
-            Panel(
-                f"[bold red]Build failed:[/bold red]\n{e}",
-                border_style="red",
-            )
-        )
-        sys.exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Build interrupted by user[/yellow]")
-        sys.exit(130)
-    except Exception as e:
-        console.print(
-            Panel(
-                f"[bold red]Unexpected error:[/bold red]\n{e}",
-                border_style="red",
-            )
-        )
-        if verbose:
-            console.print_exception()
-        sys.exit(1)
+    show_build_summary([BuildTarget.PLUGIN], clean, verbose, release, target)
+    tools = validate_tools([BuildTarget.PLUGIN])
+    build_plugin(
+        clean=clean,
+        verbose=verbose,
+        release=release,
+        target=target,
+        js_pm=tools["js_pm"],
+        # Opt-in: the JS build replaces this process, so the result panels
+        # and error handling are skipped. Only safe without cleanup threads
+        # or captured output to report.
+        exec_js_build=exec_js and not clean and not verbose and os.name == "posix",
+    )
 
 
 @app.command()
+@_build_command("Tauri MCP Server - MCP Build", "MCP server build successful! ✓")
 def mcp(
     clean: Annotated[
         bool,
@@ -443,50 +1247,13 @@ def mcp(
     ] = False,
 ) -> None:
     """Build the TypeScript MCP server."""
-    try:
-        console.print(
-            Panel(
-                "[bold]Tauri MCP Server - MCP Build[/bold]",
-                border_style="cyan",
-            )
-        )
-
-        show_build_summary([BuildTarget.MCP], clean, verbose, False, None)
-        validate_tools([BuildTarget.MCP])
-        build_mcp(clean=clean, verbose=verbose)
-
-        console.print(
-            Panel(
-                "[bold green]MCP server build successful! ✓[/bold green]",
-                border_style="green",
-            )
-        )
-        sys.exit(0)
-
-    except BuildError as e:
-        console.print(
-            Panel(
-                f"[bold red]Build failed:[/bold red]\n{e}",
-                border_style="red",
-            )
-        )
-        sys.exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Build interrupted by user[/yellow]")
-        sys.exit(130)
-    except Exception as e:
-        console.print(
-            Panel(
-                f"[bold red]Unexpected error:[/bold red]\n{e}",
-                border_style="red",
-            )
-        )
-        if verbose:
-            console.print_exception()
-        sys.exit(1)
+    show_build_summary([BuildTarget.MCP], clean, verbose, False, None)
+    tools = validate_tools([BuildTarget.MCP])
+    build_mcp(clean=clean, verbose=verbose, js_pm=tools["js_pm"])
 
 
 @app.command()
+@_build_command("Tauri MCP Server - Full Build", "All builds successful! ✓")
 def all(
     clean: Annotated[
         bool,
@@ -506,53 +1273,91 @@ def all(
     ] = None,
 ) -> None:
     """Build both the plugin and MCP server."""
-    try:
-        console.print(
-            Panel(
-                "[bold]Tauri MCP Server - Full Build[/bold]",
-                border_style="cyan",
-            )
+    show_build_summary([BuildTarget.ALL], clean, verbose, release, target)
+    tools = validate_tools([BuildTarget.ALL])
+
+    # Build plugin and MCP server concurrently; they write to disjoint
+    # directories (target/ and dist-js/ vs mcp-server-ts/build/)
+    with create_progress() as progress:
+        run_concurrently(
+            [
+                partial(
+                    build_plugin,
+                    clean=clean,
+                    verbose=verbose,
+                    release=release,
+                    target=target,
+                    js_pm=tools["js_pm"],
+                    progress=progress,
+                ),
+                partial(
+                    build_mcp,
+                    clean=clean,
+                    verbose=verbose,
+                    js_pm=tools["js_pm"],
+                    progress=progress,
+                ),
+            ]
         )
 
-        show_build_summary([BuildTarget.ALL], clean, verbose, release, target)
-        validate_tools([BuildTarget.ALL])
 
-        # Build plugin first
-        build_plugin(clean=clean, verbose=verbose, release=release, target=target)
+def minimal_main(argv: list[str] | None = None) -> None:
+    """
+    Run the build CLI without Typer's parser or Rich output.
 
-        # Build MCP server
-        build_mcp(clean=clean, verbose=verbose)
+    Used in CI and other non-interactive runs, where the output is captured
+    and spinners and panels only cost startup time. Accepts the same commands
+    and options as the Typer app.
 
-        console.print(
-            Panel(
-                "[bold green]All builds successful! ✓[/bold green]",
-                border_style="green",
-            )
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    global _plain_output
+    _plain_output = True
+
+    parser = argparse.ArgumentParser(
+        prog="build.py", description="Build system for Tauri MCP Server project"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for command in (plugin, mcp, all):
+        subparser = subparsers.add_parser(command.__name__, help=command.__doc__)
+        subparser.add_argument(
+            "--clean", "-c", action="store_true", help="Clean build artifacts before building"
         )
-        sys.exit(0)
-
-    except BuildError as e:
-        console.print(
-            Panel(
-                f"[bold red]Build failed:[/bold red]\n{e}",
-                border_style="red",
-            )
+        subparser.add_argument(
+            "--verbose", "-v", action="store_true", help="Show detailed build output"
         )
-        sys.exit(1)
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Build interrupted by user[/yellow]")
-        sys.exit(130)
-    except Exception as e:
-        console.print(
-            Panel(
-                f"[bold red]Unexpected error:[/bold red]\n{e}",
-                border_style="red",
+        if command is not mcp:
+            subparser.add_argument(
+                "--release",
+                "-r",
+                action="store_true",
+                default=True,
+                help="Build in release mode",
             )
-        )
-        if verbose:
-            console.print_exception()
-        sys.exit(1)
+            subparser.add_argument(
+                "--target",
+                "-t",
+                default=None,
+                help="Rust target triple (e.g., x86_64-unknown-linux-gnu)",
+            )
+        if command is plugin:
+            subparser.add_argument(
+                "--exec-js",
+                action="store_true",
+                help="When Rust is up to date, hand the process over to the JS build (POSIX only)",
+            )
+        subparser.set_defaults(func=command)
+
+    options = vars(parser.parse_args(argv))
+    del options["command"]
+    command = options.pop("func")
+    command(**options)
 
 
 if __name__ == "__main__":
-    app()
+    if os.environ.get("BUILD_PY_MINIMAL") or not sys.stdout.isatty():
+        minimal_main()
+    else:
+        app()
@@ -12,37 +12,97 @@ Usage:
     python publish.py all [--bump patch|minor|major] [--dry-run] [--skip-build]
 """
 
+from __future__ import annotations
+
+import argparse
 import json
+import os
+import shutil
+import signal
 import subprocess
 import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from enum import Enum
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Annotated, Optional
+from types import ModuleType
+from typing import TYPE_CHECKING, Annotated, Any, Optional, cast
+
+# Rich and Typer are imported where they are used, so startup and --help
+# stay fast
+if TYPE_CHECKING:
+    import typer
+    from rich.console import Console
+
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+
+@cache
+def get_console() -> Console:
+    """Create the shared Rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+class _LazyConsole:
+    """Stand-in for the Rich console that creates it on first attribute access."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_console(), name)
 
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm
-from rich.table import Table
 
-# Initialize Rich console for beautiful output
-console = Console()
+# Rich console for beautiful output
+console = _LazyConsole()
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.resolve()
 PLUGIN_PACKAGE_JSON = PROJECT_ROOT / "package.json"
 MCP_PACKAGE_JSON = PROJECT_ROOT / "mcp-server-ts" / "package.json"
 
+# Upper bound on packages processed at the same time
+MAX_PARALLEL_PACKAGES = 4
+
+# Rich allows only one live display at a time; held by whichever package
+# currently shows a status spinner
+_status_lock = threading.Lock()
+
+# Real publishes run one after another: those sending the shared OTP so they
+# don't race each other inside the code's 30-second window, and those without
+# one because npm may prompt for it on the terminal (builds still run in
+# parallel)
+_otp_publish_lock = threading.Semaphore(1)
+
+# Builds started before the user confirmed, so a cancel can stop them
+_speculative_processes: set[subprocess.Popen] = set()
+_speculative_lock = threading.Lock()
+_speculative_cancelled = threading.Event()
+
 # 1Password configuration
 ONEPASSWORD_VAULT = "DeLoSecrets"
 ONEPASSWORD_ITEM = "npmjs"
 
-# Initialize Typer app
-app = typer.Typer(
-    name="publish",
-    help="Publish Tauri MCP project packages to npm registry",
-    add_completion=False,
-)
+# TOTP codes rotate every 30 seconds; an OTP older than this is refetched
+OTP_MAX_AGE_SECONDS = 20
+
+# Extra environment for the release's own git commands. git status and
+# git tag -a never run hooks, so this is defensive: it switches off husky and
+# lefthook should a hook manager wrap those commands, and lets pre-commit run
+# without a config file (it does not disable pre-commit). Set
+# PUBLISH_GIT_HOOKS=1 to leave the environment alone.
+GIT_NO_HOOKS_ENV = {
+    "LEFTHOOK": "0",
+    "HUSKY": "0",
+    "PRE_COMMIT_ALLOW_NO_CONFIG": "1",
+}
 
 
 class BumpType(str, Enum):
@@ -61,31 +121,141 @@ class PublishTarget(str, Enum):
     ALL = "all"
 
 
+def _parse_version(version: str) -> tuple[int, int, int]:
+    """
+    Split a "major.minor.patch" version string into integers.
+
+    Args:
+        version: Version string
+
+    Returns:
+        Tuple of (major, minor, patch)
+    """
+    major, minor, patch = map(int, version.split("."))
+    return major, minor, patch
+
+
+def _json_loads(data: bytes) -> dict:
+    """
+    Parse JSON bytes, using orjson when it is installed.
+
+    Args:
+        data: Raw JSON document
+
+    Returns:
+        Parsed JSON object
+    """
+    if orjson is not None:
+        return cast(dict, orjson.loads(data))
+    return cast(dict, json.loads(data))
+
+
+def _json_dumps(data: dict) -> bytes:
+    """
+    Serialize package.json data with 2-space indent and a trailing newline.
+
+    Args:
+        data: JSON object to serialize
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return cast(
+            bytes, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        )
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@lru_cache(maxsize=32)
+def _bumped_version(parsed: tuple[int, int, int], bump_type: BumpType) -> str:
+    """
+    Format the version that follows a parsed version for a bump type.
+
+    Cached because the summary table and the update step ask for the same
+    bump of the same version.
+
+    Args:
+        parsed: Current (major, minor, patch)
+        bump_type: Type of version bump (patch, minor, major)
+
+    Returns:
+        The new version string
+    """
+    major, minor, patch = parsed
+    if bump_type == BumpType.MAJOR:
+        return f"{major + 1}.0.0"
+    if bump_type == BumpType.MINOR:
+        return f"{major}.{minor + 1}.0"
+    return f"{major}.{minor}.{patch + 1}"
+
+
+def _file_stamp(path: Path) -> tuple[int, int]:
+    """
+    Get a file's modification time and size for use as a cache key.
+
+    The size catches edits made within the same mtime tick.
+
+    Args:
+        path: File to check
+
+    Returns:
+        (st_mtime_ns, st_size), or (0, 0) if the file cannot be stat'ed
+        (loading reports why)
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return 0, 0
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=4)
+def _load_pkg_cached(path: Path, _stamp: tuple[int, int]) -> dict:
+    """
+    Parse a package.json, reusing the result until the file changes.
+
+    Args:
+        path: package.json to read
+        _stamp: File stamp from _file_stamp; only used as the cache key
+
+    Returns:
+        Parsed package.json (shared; copy before modifying)
+    """
+    return _json_loads(path.read_bytes())
+
+
 class PackageInfo:
     """Package information and metadata."""
 
     def __init__(self, name: str, path: Path, package_json_path: Path):
         self.name = name
         self.path = path
+        # Shown in the summary table; packages outside the project keep their full path
+        self.relative_path = (
+            str(path.relative_to(PROJECT_ROOT)) if path.is_relative_to(PROJECT_ROOT) else str(path)
+        )
         self.package_json_path = package_json_path
         self._data: dict = {}
+        # Parsed on the first bump; prerelease versions only fail when bumped
+        self._parsed_version: Optional[tuple[int, int, int]] = None
         self._load_package_json()
 
     def _load_package_json(self) -> None:
         """Load package.json data."""
         try:
-            with open(self.package_json_path, "r", encoding="utf-8") as f:
-                self._data = json.load(f)
+            path = self.package_json_path
+            self._data = dict(_load_pkg_cached(path, _file_stamp(path)))
         except FileNotFoundError:
             console.print(
                 f"[red]Error: package.json not found at {self.package_json_path}[/red]"
             )
-            raise typer.Exit(1)
+            raise SystemExit(1)
         except json.JSONDecodeError as e:
             console.print(
                 f"[red]Error: Invalid JSON in {self.package_json_path}: {e}[/red]"
             )
-            raise typer.Exit(1)
+            raise SystemExit(1)
 
     @property
     def npm_name(self) -> str:
@@ -107,19 +277,9 @@ class PackageInfo:
         Returns:
             The new version string
         """
-        major, minor, patch = map(int, self.version.split("."))
-
-        if bump_type == BumpType.MAJOR:
-            major += 1
-            minor = 0
-            patch = 0
-        elif bump_type == BumpType.MINOR:
-            minor += 1
-            patch = 0
-        elif bump_type == BumpType.PATCH:
-            patch += 1
-
-        return f"{major}.{minor}.{patch}"
+        if self._parsed_version is None:
+            self._parsed_version = _parse_version(self.version)
+        return _bumped_version(self._parsed_version, bump_type)
 
     def update_version(self, new_version: str, dry_run: bool = False) -> None:
         """
@@ -137,21 +297,118 @@ class PackageInfo:
             return
 
         self._data["version"] = new_version
+        self._parsed_version = None
 
-        with open(self.package_json_path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, indent=2, ensure_ascii=False)
-            f.write("\n")  # Add trailing newline
+        # Write the whole document to a temp file and swap it in, so a failed
+        # write never leaves a truncated package.json behind
+        payload = _json_dumps(self._data)
+        tmp_path = self.package_json_path.with_suffix(".json.tmp")
+        try:
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self.package_json_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         console.print(
             f"[green]Updated {self.package_json_path} to version {new_version}[/green]"
         )
 
 
+@cache
+def find_executable(name: str) -> Optional[str]:
+    """
+    Look up a command on PATH once per run.
+
+    Args:
+        name: Command name (e.g. "npm")
+
+    Returns:
+        Path to the executable, or None if it is not installed
+    """
+    return shutil.which(name)
+
+
+def resolve_executable(name: str) -> str:
+    """
+    Resolve a command name to its full path on PATH.
+
+    subprocess can only use the cheaper posix_spawn() when given a path to the
+    executable. An unknown name is returned unchanged so the spawn still raises
+    FileNotFoundError.
+
+    Args:
+        name: Command name (e.g. "git")
+
+    Returns:
+        Path to the executable, or the name itself if it is not on PATH
+    """
+    return find_executable(name) or name
+
+
+@lru_cache(maxsize=1)
+def _git_env() -> Optional[dict[str, str]]:
+    """
+    Build the environment for git commands once per run.
+
+    The full environment is kept (1Password sessions, proxies and SystemRoot
+    on Windows all matter); only the hook switches are added.
+
+    Returns:
+        Environment with hooks disabled, or None to inherit it unchanged
+    """
+    if os.environ.get("PUBLISH_GIT_HOOKS") == "1":
+        return None
+    return os.environ | GIT_NO_HOOKS_ENV
+
+
+def _stream_command(
+    cmd: list[str],
+    cwd: Optional[Path],
+    check: bool,
+    env: Optional[dict[str, str]],
+) -> subprocess.CompletedProcess:
+    """
+    Run a command, echoing its output through the console as it is produced.
+
+    Args:
+        cmd: Command and arguments as a list
+        cwd: Working directory for the command
+        check: If True, raise exception on non-zero exit
+        env: Environment for the command, or None to inherit
+
+    Returns:
+        CompletedProcess instance without captured output
+
+    Raises:
+        subprocess.CalledProcessError: If command fails and check=True
+    """
+    with subprocess.Popen(
+        [resolve_executable(cmd[0]), *cmd[1:]],
+        cwd=cwd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        close_fds=False,
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            console.print(line, end="", markup=False, highlight=False)
+        returncode = proc.wait()
+
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    return subprocess.CompletedProcess(cmd, returncode)
+
+
 def run_command(
     cmd: list[str],
     cwd: Optional[Path] = None,
     check: bool = True,
     capture_output: bool = False,
+    stream: bool = False,
 ) -> subprocess.CompletedProcess:
     """
     Run a shell command with error handling.
@@ -161,6 +418,8 @@ def run_command(
         cwd: Working directory for the command
         check: If True, raise exception on non-zero exit
         capture_output: If True, capture stdout and stderr
+        stream: If True, print combined stdout and stderr line by line as it
+            arrives instead of buffering it (ignores capture_output)
 
     Returns:
         CompletedProcess instance
@@ -168,13 +427,28 @@ def run_command(
     Raises:
         subprocess.CalledProcessError: If command fails and check=True
     """
+    # Other commands inherit the environment directly, without a copy
+    env = None
+    if cmd[0] == "git":
+        env = _git_env()
+        # Passing cwd rules out posix_spawn(); git can change directory itself
+        if cwd is not None:
+            cmd = ["git", "-C", str(cwd), *cmd[1:]]
+            cwd = None
+
     try:
+        if stream:
+            return _stream_command(cmd, cwd, check, env)
+        # close_fds=False is needed for posix_spawn(); descriptors Python opens
+        # are non-inheritable anyway, so nothing extra leaks to the child
         return subprocess.run(
-            cmd,
+            [resolve_executable(cmd[0]), *cmd[1:]],
             cwd=cwd,
             check=check,
             capture_output=capture_output,
             text=True,
+            env=env,
+            close_fds=False,
         )
     except subprocess.CalledProcessError as e:
         console.print(f"[red]Command failed: {' '.join(cmd)}[/red]")
@@ -183,6 +457,29 @@ def run_command(
         raise
 
 
+@contextmanager
+def status(message: str) -> Iterator[None]:
+    """
+    Show a status spinner while a step runs.
+
+    When packages are processed in parallel only one of them can own the
+    spinner; the others print the message as a plain line instead.
+
+    Args:
+        message: Status message (Rich markup)
+    """
+    if not _status_lock.acquire(blocking=False):
+        console.print(message)
+        yield
+        return
+
+    try:
+        with console.status(message):
+            yield
+    finally:
+        _status_lock.release()
+
+
 def check_git_clean() -> bool:
     """
     Check if the git working directory is clean.
@@ -192,11 +489,12 @@ def check_git_clean() -> bool:
     """
     try:
         result = run_command(
-            ["git", "status", "--porcelain"],
+            ["git", "status", "--porcelain", "-z"],
             cwd=PROJECT_ROOT,
             capture_output=True,
         )
-        return len(result.stdout.strip()) == 0
+        # Porcelain output is empty exactly when the tree is clean
+        return not result.stdout
     except subprocess.CalledProcessError:
         console.print("[yellow]Warning: Could not check git status[/yellow]")
         return True  # Continue anyway
@@ -209,6 +507,10 @@ def check_npm_credentials() -> bool:
     Returns:
         True if npm is logged in, False otherwise
     """
+    if find_executable("npm") is None:
+        console.print("[red]Error: npm command not found[/red]")
+        return False
+
     try:
         result = run_command(
             ["npm", "whoami"],
@@ -233,9 +535,26 @@ def get_otp_from_1password() -> Optional[str]:
     """
     Fetch npm OTP from 1Password using the `op` CLI.
 
+    An OTP in the NPM_OTP environment variable is used as-is, and no OTP is
+    fetched when NPM_TOKEN is set (granular access tokens need none).
+
     Returns:
         OTP code if successful, None otherwise
     """
+    if otp := os.environ.get("NPM_OTP"):
+        console.print("[green]Using OTP from NPM_OTP[/green]")
+        return otp
+
+    if os.environ.get("NPM_TOKEN"):
+        console.print("[green]Using NPM_TOKEN, skipping OTP[/green]")
+        return None
+
+    if find_executable("op") is None:
+        console.print(
+            "[yellow]1Password CLI (op) not found, skipping OTP[/yellow]"
+        )
+        return None
+
     try:
         result = run_command(
             [
@@ -269,6 +588,17 @@ def get_otp_from_1password() -> Optional[str]:
         return None
 
 
+def _fetch_otp() -> tuple[Optional[str], float]:
+    """
+    Fetch the npm OTP and note when it was fetched.
+
+    Returns:
+        The OTP (or None) and its time.monotonic() fetch time
+    """
+    otp = get_otp_from_1password()
+    return otp, time.monotonic()
+
+
 def create_git_tag(version: str, dry_run: bool = False) -> None:
     """
     Create a git tag for the version.
@@ -314,13 +644,87 @@ def build_package(pkg: PackageInfo, skip_build: bool = False, dry_run: bool = Fa
         )
         return
 
-    with console.status(f"[bold blue]Building {pkg.name}..."):
+    with status(f"[bold blue]Building {pkg.name}..."):
         try:
-            run_command(["npm", "run", "build"], cwd=pkg.path)
+            run_command(["npm", "run", "build"], cwd=pkg.path, stream=True)
             console.print(f"[green]Successfully built {pkg.name}[/green]")
         except subprocess.CalledProcessError:
             console.print(f"[red]Build failed for {pkg.name}[/red]")
-            raise typer.Exit(1)
+            raise SystemExit(1)
+
+
+def _speculative_build(pkg: PackageInfo) -> bool:
+    """
+    Build a package quietly while the user is still answering prompts.
+
+    Output is discarded and nothing is printed, so the prompts stay readable;
+    a failed build is simply run again normally. The build can be stopped with
+    _cancel_speculative_builds.
+
+    Args:
+        pkg: Package information
+
+    Returns:
+        True if the build succeeded
+    """
+    try:
+        # Own process group, so cancelling also stops the build npm starts
+        process = subprocess.Popen(
+            [resolve_executable("npm"), "run", "build"],
+            cwd=pkg.path,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=os.name == "posix",
+        )
+    except OSError:
+        return False
+
+    with _speculative_lock:
+        _speculative_processes.add(process)
+        if _speculative_cancelled.is_set():
+            _stop_process_tree(process)
+
+    try:
+        return process.wait() == 0
+    finally:
+        with _speculative_lock:
+            _speculative_processes.discard(process)
+
+
+def _stop_process_tree(process: subprocess.Popen) -> None:
+    """
+    Terminate a build process and the children it started.
+
+    Args:
+        process: Process started by _speculative_build
+    """
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+    except (ProcessLookupError, PermissionError):
+        pass  # Already exited
+
+
+def _cancel_speculative_builds(executor: ThreadPoolExecutor) -> None:
+    """
+    Stop speculative builds after the publish was cancelled.
+
+    Args:
+        executor: Executor the builds were submitted to
+    """
+    executor.shutdown(wait=False, cancel_futures=True)
+    with _speculative_lock:
+        _speculative_cancelled.set()
+        running = list(_speculative_processes)
+        for process in running:
+            _stop_process_tree(process)
+
+    if running:
+        console.print("[dim]Stopping background builds...[/dim]")
+    executor.shutdown(wait=True)
 
 
 def publish_package(
@@ -345,9 +749,23 @@ def publish_package(
         cmd.append("--dry-run")
         console.print(f"[yellow]DRY RUN: {' '.join(cmd)}[/yellow]")
 
+    # Without an OTP npm may ask for one, which it only does when stdin and
+    # stdout are the terminal. Such a publish inherits stdio instead of being
+    # streamed, and holds the status lock so no spinner draws over the prompt;
+    # _publish runs these only once every build has finished.
+    interactive = not otp and not dry_run
+
     try:
-        with console.status(f"[bold blue]Publishing {pkg.npm_name}..."):
-            run_command(cmd, cwd=pkg.path)
+        if interactive:
+            with _otp_publish_lock, _status_lock:
+                console.print(f"[bold blue]Publishing {pkg.npm_name}...")
+                run_command(cmd, cwd=pkg.path)
+        else:
+            with (
+                _otp_publish_lock if otp else nullcontext(),
+                status(f"[bold blue]Publishing {pkg.npm_name}..."),
+            ):
+                run_command(cmd, cwd=pkg.path, stream=True)
 
         if dry_run:
             console.print(
@@ -359,7 +777,7 @@ def publish_package(
             )
     except subprocess.CalledProcessError:
         console.print(f"[red]Failed to publish {pkg.npm_name}[/red]")
-        raise typer.Exit(1)
+        raise SystemExit(1)
 
 
 def display_publish_summary(
@@ -377,6 +795,8 @@ def display_publish_summary(
         dry_run: Whether this is a dry run
         skip_build: Whether build is skipped
     """
+    from rich.table import Table
+
     table = Table(title="Publish Summary", show_header=True, header_style="bold magenta")
     table.add_column("Package", style="cyan", width=30)
     table.add_column("Current Version", style="yellow")
@@ -389,7 +809,7 @@ def display_publish_summary(
             pkg.npm_name,
             pkg.version,
             new_version if bump_type else "(no change)",
-            str(pkg.path.relative_to(PROJECT_ROOT)),
+            pkg.relative_path,
         )
 
     console.print()
@@ -410,6 +830,25 @@ def display_publish_summary(
         console.print()
 
 
+@lru_cache(maxsize=8)
+def _get_package_info(
+    name: str, path: Path, package_json_path: Path, _stamp: tuple[int, int]
+) -> PackageInfo:
+    """
+    Get the PackageInfo for a package, loading its package.json only once.
+
+    Args:
+        name: Display name of the package
+        path: Package directory
+        package_json_path: Path to the package.json
+        _stamp: File stamp of package.json, so edits load a fresh instance
+
+    Returns:
+        Shared PackageInfo instance
+    """
+    return PackageInfo(name=name, path=path, package_json_path=package_json_path)
+
+
 def get_packages(target: PublishTarget) -> list[PackageInfo]:
     """
     Get the list of packages to publish based on the target.
@@ -424,26 +863,27 @@ def get_packages(target: PublishTarget) -> list[PackageInfo]:
 
     if target in (PublishTarget.PLUGIN, PublishTarget.ALL):
         packages.append(
-            PackageInfo(
+            _get_package_info(
                 name="Tauri Plugin",
                 path=PROJECT_ROOT,
                 package_json_path=PLUGIN_PACKAGE_JSON,
+                _stamp=_file_stamp(PLUGIN_PACKAGE_JSON),
             )
         )
 
     if target in (PublishTarget.MCP, PublishTarget.ALL):
         packages.append(
-            PackageInfo(
+            _get_package_info(
                 name="MCP Server",
                 path=PROJECT_ROOT / "mcp-server-ts",
                 package_json_path=MCP_PACKAGE_JSON,
+                _stamp=_file_stamp(MCP_PACKAGE_JSON),
             )
         )
 
     return packages
 
 
-@app.command()
 def plugin(
     bump: Annotated[
         Optional[BumpType],
@@ -457,13 +897,29 @@ def plugin(
         bool,
         typer.Option("--skip-build", "-s", help="Skip the build step"),
     ] = False,
+    speculative_build: Annotated[
+        bool,
+        typer.Option(
+            "--speculative-build/--no-speculative-build",
+            help="Start building while waiting for confirmation",
+        ),
+    ] = True,
+    allow_dirty: Annotated[
+        bool,
+        typer.Option("--allow-dirty", help="Publish even if the git working directory is dirty"),
+    ] = False,
+    yes: Annotated[
+        bool,
+        typer.Option("--yes", "-y", help="Answer yes to all confirmation prompts"),
+    ] = False,
 ) -> None:
     """Publish the Tauri plugin package to npm."""
+    from rich.panel import Panel
+
     console.print(Panel.fit("[bold cyan]Publishing Tauri Plugin[/bold cyan]"))
-    _publish(PublishTarget.PLUGIN, bump, dry_run, skip_build)
+    _publish(PublishTarget.PLUGIN, bump, dry_run, skip_build, speculative_build, allow_dirty, yes)
 
 
-@app.command()
 def mcp(
     bump: Annotated[
         Optional[BumpType],
@@ -477,13 +933,29 @@ def mcp(
         bool,
         typer.Option("--skip-build", "-s", help="Skip the build step"),
     ] = False,
+    speculative_build: Annotated[
+        bool,
+        typer.Option(
+            "--speculative-build/--no-speculative-build",
+            help="Start building while waiting for confirmation",
+        ),
+    ] = True,
+    allow_dirty: Annotated[
+        bool,
+        typer.Option("--allow-dirty", help="Publish even if the git working directory is dirty"),
+    ] = False,
+    yes: Annotated[
+        bool,
+        typer.Option("--yes", "-y", help="Answer yes to all confirmation prompts"),
+    ] = False,
 ) -> None:
     """Publish the MCP server package to npm."""
+    from rich.panel import Panel
+
     console.print(Panel.fit("[bold cyan]Publishing MCP Server[/bold cyan]"))
-    _publish(PublishTarget.MCP, bump, dry_run, skip_build)
+    _publish(PublishTarget.MCP, bump, dry_run, skip_build, speculative_build, allow_dirty, yes)
 
 
-@app.command()
 def all(
     bump: Annotated[
         Optional[BumpType],
@@ -497,10 +969,99 @@ def all(
         bool,
         typer.Option("--skip-build", "-s", help="Skip the build step"),
     ] = False,
+    speculative_build: Annotated[
+        bool,
+        typer.Option(
+            "--speculative-build/--no-speculative-build",
+            help="Start building while waiting for confirmation",
+        ),
+    ] = True,
+    allow_dirty: Annotated[
+        bool,
+        typer.Option("--allow-dirty", help="Publish even if the git working directory is dirty"),
+    ] = False,
+    yes: Annotated[
+        bool,
+        typer.Option("--yes", "-y", help="Answer yes to all confirmation prompts"),
+    ] = False,
 ) -> None:
     """Publish both plugin and MCP server packages to npm."""
+    from rich.panel import Panel
+
     console.print(Panel.fit("[bold cyan]Publishing All Packages[/bold cyan]"))
-    _publish(PublishTarget.ALL, bump, dry_run, skip_build)
+    _publish(PublishTarget.ALL, bump, dry_run, skip_build, speculative_build, allow_dirty, yes)
+
+
+def confirm(question: str, assume_yes: bool = False) -> bool:
+    """
+    Ask a yes/no question, defaulting to no.
+
+    Without a terminal on stdin (e.g. in CI) nothing is prompted; the answer
+    comes from the PUBLISH_CONFIRM environment variable instead.
+
+    Args:
+        question: Question to ask (Rich markup)
+        assume_yes: If True, answer yes without asking
+
+    Returns:
+        True if the answer was yes
+    """
+    if assume_yes:
+        return True
+
+    if not sys.stdin.isatty():
+        answer = os.environ.get("PUBLISH_CONFIRM", "").lower() in {"1", "true", "yes", "y"}
+        console.print(f"{question} [dim](PUBLISH_CONFIRM: {'yes' if answer else 'no'})[/dim]")
+        return answer
+
+    from rich.prompt import Confirm
+
+    return Confirm.ask(question, default=False)
+
+
+def _process_package(
+    pkg: PackageInfo,
+    otp: Optional[str],
+    bump: Optional[BumpType],
+    dry_run: bool,
+    skip_build: bool,
+    build: Optional[Future[bool]] = None,
+    publish: bool = True,
+) -> None:
+    """
+    Bump, tag, build and publish a single package.
+
+    Args:
+        pkg: Package to process
+        otp: One-time password for npm 2FA
+        bump: Version bump type
+        dry_run: Whether to perform a dry run
+        skip_build: Whether to skip building
+        build: Speculative build started before confirmation, if any
+        publish: Whether to publish as well, or leave it to the caller
+    """
+    console.print()
+    console.print(f"[bold]Processing {pkg.name}...[/bold]")
+
+    # Bump version if requested
+    if bump:
+        new_version = pkg.bump_version(bump)
+        pkg.update_version(new_version, dry_run)
+
+        # Create git tag for the new version
+        if not dry_run:
+            create_git_tag(new_version, dry_run)
+
+    # Build package, unless the speculative build already succeeded. A failed
+    # speculative build is rerun normally so its errors are shown.
+    if build is not None and build.result():
+        console.print(f"[green]Successfully built {pkg.name}[/green]")
+    else:
+        build_package(pkg, skip_build, dry_run)
+
+    # Publish package
+    if publish:
+        publish_package(pkg, otp, dry_run)
 
 
 def _publish(
@@ -508,6 +1069,9 @@ def _publish(
     bump: Optional[BumpType],
     dry_run: bool,
     skip_build: bool,
+    speculative_build: bool = True,
+    allow_dirty: bool = False,
+    assume_yes: bool = False,
 ) -> None:
     """
     Internal publish implementation.
@@ -517,64 +1081,128 @@ def _publish(
         bump: Version bump type
         dry_run: Whether to perform a dry run
         skip_build: Whether to skip building
+        speculative_build: Whether to start builds before the user confirms
+        allow_dirty: Whether to skip the git working directory check
+        assume_yes: Whether to answer yes to all prompts
     """
+    from rich.panel import Panel
+
     # Get packages to publish
     packages = get_packages(target)
 
     # Display summary
     display_publish_summary(packages, bump, dry_run, skip_build)
 
-    # Safety checks
-    if not dry_run:
-        # Check git status
-        if not check_git_clean():
-            console.print(
-                "[yellow]Warning: Git working directory is not clean[/yellow]"
-            )
-            if not Confirm.ask("Continue anyway?", default=False):
-                console.print("[red]Publish cancelled[/red]")
-                raise typer.Exit(0)
-
-        # Check npm credentials
-        if not check_npm_credentials():
-            console.print("[red]Please log in to npm first with 'npm login'[/red]")
-            raise typer.Exit(1)
-
-        # Confirm publish
-        if not Confirm.ask(
-            "[bold yellow]Proceed with publish?[/bold yellow]", default=False
-        ):
-            console.print("[red]Publish cancelled[/red]")
-            raise typer.Exit(0)
-
-    # Get OTP if not dry run
     otp = None
+    builds: dict[str, Future[bool]] = {}
+    build_executor: Optional[ThreadPoolExecutor] = None
+
+    # Safety checks
     if not dry_run:
-        otp = get_otp_from_1password()
-        if not otp:
+        # The checks are independent subprocesses, so run them at the same
+        # time. The OTP is fetched up front as well, so it is usually ready
+        # by the time the user confirms.
+        try:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                git_clean = None if allow_dirty else executor.submit(check_git_clean)
+                npm_logged_in = executor.submit(check_npm_credentials)
+                otp_fetch = executor.submit(_fetch_otp)
+
+                # Check git status
+                if git_clean is not None and not git_clean.result():
+                    console.print(
+                        "[yellow]Warning: Git working directory is not clean[/yellow]"
+                    )
+                    if not confirm("Continue anyway?", assume_yes):
+                        console.print("[red]Publish cancelled[/red]")
+                        raise SystemExit(0)
+
+                # Start the builds so they run while the user answers the
+                # remaining prompts. Only now: they write dist-js/ and build/,
+                # which git status would otherwise report as changes.
+                if speculative_build and not skip_build:
+                    _speculative_cancelled.clear()
+                    build_executor = ThreadPoolExecutor(
+                        max_workers=min(len(packages), MAX_PARALLEL_PACKAGES)
+                    )
+                    builds = {
+                        pkg.name: build_executor.submit(_speculative_build, pkg)
+                        for pkg in packages
+                    }
+
+                # Check npm credentials
+                if not npm_logged_in.result():
+                    console.print("[red]Please log in to npm first with 'npm login'[/red]")
+                    raise SystemExit(1)
+
+                # Confirm publish
+                if not confirm("[bold yellow]Proceed with publish?[/bold yellow]", assume_yes):
+                    console.print("[red]Publish cancelled[/red]")
+                    raise SystemExit(0)
+
+                otp, fetched_at = otp_fetch.result()
+        except BaseException:
+            if build_executor is not None:
+                _cancel_speculative_builds(build_executor)
+            raise
+
+        # TOTP codes expire; fetch a fresh one if the prompts took too long
+        if otp and time.monotonic() - fetched_at > OTP_MAX_AGE_SECONDS:
+            otp = get_otp_from_1password()
+
+        if not otp and not os.environ.get("NPM_TOKEN"):
             console.print(
                 "[yellow]Publishing without OTP. You may be prompted for it.[/yellow]"
             )
 
-    # Process each package
-    for pkg in packages:
+    # Without an OTP npm may prompt on the terminal, so publish only after
+    # every build has finished; their streamed output would run into the prompt
+    interactive = not otp and not dry_run
+
+    # Process packages in parallel; each publish mostly waits on the registry
+    with ThreadPoolExecutor(
+        max_workers=min(len(packages), MAX_PARALLEL_PACKAGES)
+    ) as executor:
+        futures = {
+            executor.submit(
+                _process_package,
+                pkg,
+                otp,
+                bump,
+                dry_run,
+                skip_build,
+                builds.get(pkg.name),
+                not interactive,
+            ): pkg
+            for pkg in packages
+        }
+
+    if build_executor is not None:
+        build_executor.shutdown()
+
+    failed: list[str] = []
+    for future, pkg in futures.items():
+        error = future.exception()
+        if error is None:
+            continue
+        failed.append(pkg.name)
+        # SystemExit means the failure was already reported
+        if not isinstance(error, SystemExit):
+            console.print(f"[red]Error processing {pkg.name}: {error}[/red]")
+
+    if interactive:
+        for pkg in packages:
+            if pkg.name in failed:
+                continue
+            try:
+                publish_package(pkg, otp, dry_run)
+            except SystemExit:
+                failed.append(pkg.name)
+
+    if failed:
         console.print()
-        console.print(f"[bold]Processing {pkg.name}...[/bold]")
-
-        # Bump version if requested
-        if bump:
-            new_version = pkg.bump_version(bump)
-            pkg.update_version(new_version, dry_run)
-
-            # Create git tag for the new version
-            if not dry_run:
-                create_git_tag(new_version, dry_run)
-
-        # Build package
-        build_package(pkg, skip_build, dry_run)
-
-        # Publish package
-        publish_package(pkg, otp, dry_run)
+        console.print(f"[red]Publish failed for: {', '.join(failed)}[/red]")
+        raise SystemExit(1)
 
     # Success message
     console.print()
@@ -598,9 +1226,87 @@ def _publish(
         )
 
 
+def main(argv: list[str] | None = None) -> None:
+    """
+    Parse the command line with argparse and run the chosen command.
+
+    Accepts the same commands and options as the Typer app, without loading
+    Typer or inspecting the command signatures.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(
+        prog="publish.py", description="Publish Tauri MCP project packages to npm registry"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for command in (plugin, mcp, all):
+        subparser = subparsers.add_parser(command.__name__, help=command.__doc__)
+        subparser.add_argument(
+            "--bump",
+            "-b",
+            type=BumpType,
+            choices=list(BumpType),
+            metavar="{patch,minor,major}",
+            help="Version bump type (patch, minor, major)",
+        )
+        subparser.add_argument(
+            "--dry-run", "-d", action="store_true", help="Perform a dry run without publishing"
+        )
+        subparser.add_argument(
+            "--skip-build", "-s", action="store_true", help="Skip the build step"
+        )
+        subparser.add_argument(
+            "--speculative-build",
+            action=argparse.BooleanOptionalAction,
+            default=True,
+            help="Start building while waiting for confirmation",
+        )
+        subparser.add_argument(
+            "--allow-dirty",
+            action="store_true",
+            help="Publish even if the git working directory is dirty",
+        )
+        subparser.add_argument(
+            "--yes", "-y", action="store_true", help="Answer yes to all confirmation prompts"
+        )
+        subparser.set_defaults(func=command)
+
+    options = vars(parser.parse_args(argv))
+    del options["command"]
+    command = options.pop("func")
+    command(**options)
+
+
+@cache
+def _typer_app() -> typer.Typer:
+    """Build the Typer app on first use; needs the optional typer package."""
+    # The command signatures name typer in their Annotated hints, which Typer
+    # resolves against this module's globals
+    global typer
+    import typer
+
+    app = typer.Typer(
+        name="publish",
+        help="Publish Tauri MCP project packages to npm registry",
+        add_completion=False,
+    )
+    for command in (plugin, mcp, all):
+        app.command()(command)
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `publish.app` working for callers that embed the Typer app
+    if name == "app":
+        return _typer_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 if __name__ == "__main__":
     try:
-        app()
+        main()
     except KeyboardInterrupt:
         console.print("\n[yellow]Interrupted by user[/yellow]")
         sys.exit(130)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test suite for build.py script.
+
+Run with: python -m pytest test_build.py -v
+"""
+
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Import modules from build.py
+import sys
+sys.path.insert(0, str(Path(__file__).parent))
+
+import build
+from build import (
+    BuildCancelled,
+    BuildError,
+    _cgroup_cpu_limit,
+    available_cpus,
+    build_mcp,
+    run_concurrently,
+)
+
+
+class TestMcpBuildSkip:
+    """Test the MCP up-to-date check."""
+
+    @pytest.fixture
+    def mcp_tree(self, tmp_path):
+        """Point the MCP paths at a throwaway server tree."""
+        server = tmp_path / "mcp-server-ts"
+        (server / "src").mkdir(parents=True)
+        (server / "src" / "index.ts").write_text("export {};\n")
+        (server / "package.json").write_text("{}\n")
+        with patch("build.mcp_server_dir", return_value=server), \
+             patch("build.mcp_build_dir", return_value=server / "build"), \
+             patch("build.build_cache_dir", return_value=tmp_path / ".build-cache"):
+            yield server
+
+    @staticmethod
+    def _emit(server, fail=False):
+        """Fake `npm run build` that writes output, like tsc does on type errors."""
+        def run(*args, **kwargs):
+            (server / "build").mkdir(exist_ok=True)
+            (server / "build" / "index.js").write_text("")
+            if fail:
+                raise BuildError("Command failed with exit code 2: npm run build")
+        return run
+
+    def test_success_is_skipped_next_time(self, mcp_tree):
+        """A successful build is not repeated while sources are unchanged."""
+        with patch("build.run_command", side_effect=self._emit(mcp_tree)) as run:
+            build_mcp(js_pm="npm")
+            build_mcp(js_pm="npm")
+        assert run.call_count == 1
+
+    def test_failed_build_is_rebuilt(self, mcp_tree):
+        """Output left behind by a failed build does not count as up to date."""
+        with patch("build.run_command", side_effect=self._emit(mcp_tree, fail=True)):
+            with pytest.raises(BuildError):
+                build_mcp(js_pm="npm")
+        assert (mcp_tree / "build" / "index.js").exists()
+
+        with patch("build.run_command", side_effect=self._emit(mcp_tree)) as run:
+            build_mcp(js_pm="npm")
+        assert run.call_count == 1
+
+    def test_source_change_triggers_rebuild(self, mcp_tree):
+        """Touching a source after a build makes it stale again."""
+        with patch("build.run_command", side_effect=self._emit(mcp_tree)) as run:
+            build_mcp(js_pm="npm")
+            stamp = build.build_cache_dir() / "mcp.stamp"
+            later = stamp.stat().st_mtime_ns + 1_000_000_000
+            os.utime(mcp_tree / "src" / "index.ts", ns=(later, later))
+            build_mcp(js_pm="npm")
+        assert run.call_count == 2
+
+
+class TestRunConcurrently:
+    """Test error reporting for parallel builds."""
+
+    def test_real_failure_wins_over_cancellation(self):
+        """A sibling cancelled first does not hide the error that caused it."""
+        cancelled = threading.Event()
+
+        def plugin():
+            cancelled.wait(5)
+            raise BuildError("Command failed with exit code 101")
+
+        def mcp():
+            cancelled.set()
+            raise BuildCancelled("Command cancelled: npm run build")
+
+        with patch("build.terminate_active_commands") as terminate:
+            with pytest.raises(BuildError, match="exit code 101"):
+                run_concurrently([plugin, mcp])
+        terminate.assert_called()
+
+    def test_only_cancellations(self):
+        """With nothing else to report, the cancellation is raised."""
+        def mcp():
+            raise BuildCancelled("Command cancelled: npm run build")
+
+        with patch("build.terminate_active_commands"):
+            with pytest.raises(BuildCancelled):
+                run_concurrently([lambda: None, mcp])
+
+    def test_success(self):
+        """Jobs that all succeed leave running commands alone."""
+        ran = []
+        with patch("build.terminate_active_commands") as terminate:
+            run_concurrently([lambda: ran.append(1), lambda: ran.append(2)])
+        assert sorted(ran) == [1, 2]
+        terminate.assert_not_called()
+
+
+class TestAvailableCpus:
+    """Test CPU counting for cargo's -j."""
+
+    @pytest.fixture
+    def fake_root(self, tmp_path):
+        """Resolve the absolute /proc and /sys paths inside tmp_path."""
+        with patch("build.Path", side_effect=lambda p: tmp_path / p.lstrip("/")):
+            yield tmp_path
+
+    @staticmethod
+    def _write(root, path, content):
+        file = root / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(content)
+
+    def test_cgroup_v2_quota(self, fake_root):
+        """The quota of the process's own cgroup is rounded up to whole CPUs."""
+        self._write(fake_root, "proc/self/cgroup", "0::/docker/abc\n")
+        self._write(fake_root, "sys/fs/cgroup/docker/abc/cpu.max", "150000 100000\n")
+        assert _cgroup_cpu_limit() == 2
+
+    def test_cgroup_v2_unlimited(self, fake_root):
+        """A quota of "max" means no limit."""
+        self._write(fake_root, "proc/self/cgroup", "0::/\n")
+        self._write(fake_root, "sys/fs/cgroup/cpu.max", "max 100000\n")
+        assert _cgroup_cpu_limit() is None
+
+    def test_cgroup_v1_quota(self, fake_root):
+        """The v1 CFS quota is used when there is no cpu.max."""
+        self._write(fake_root, "sys/fs/cgroup/cpu/cpu.cfs_quota_us", "200000\n")
+        self._write(fake_root, "sys/fs/cgroup/cpu/cpu.cfs_period_us", "100000\n")
+        assert _cgroup_cpu_limit() == 2
+
+    def test_no_cgroup(self, fake_root):
+        """Without cgroup files there is no limit."""
+        assert _cgroup_cpu_limit() is None
+
+    @patch("build._cgroup_cpu_limit", return_value=2)
+    def test_quota_lowers_affinity(self, _limit):
+        """The quota wins when it is below the affinity mask."""
+        with patch("build.os.sched_getaffinity", return_value=set(range(8)), create=True):
+            assert available_cpus() == 2
+
+    @patch("build._cgroup_cpu_limit", return_value=16)
+    def test_affinity_lowers_quota(self, _limit):
+        """The affinity mask wins when it is below the quota."""
+        with patch("build.os.sched_getaffinity", return_value={0, 1, 2}, create=True):
+            assert available_cpus() == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
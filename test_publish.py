@@ -3,10 +3,16 @@
 Test suite for publish.py script.
 
 Run with: python -m pytest test_publish.py -v
+Run in parallel with: python -m pytest test_publish.py -n auto (needs pytest-xdist)
+Skip slow tests (they rewrite package.json files) with: python -m pytest -m "not slow"
 """
 
 import json
+import os
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -20,10 +26,16 @@ from publish import (
     BumpType,
     PackageInfo,
     PublishTarget,
+    _git_env,
+    _publish,
     check_git_clean,
     check_npm_credentials,
+    confirm,
     get_otp_from_1password,
     get_packages,
+    publish_package,
+    MAX_PARALLEL_PACKAGES,
+    OTP_MAX_AGE_SECONDS,
     PROJECT_ROOT,
 )
 
@@ -68,6 +80,22 @@ class TestPackageInfo:
         new_version = pkg.bump_version(BumpType.MAJOR)
         assert new_version == "2.0.0"
 
+    def test_prerelease_version_loads(self, tmp_path):
+        """Test a prerelease version only fails when it is bumped."""
+        package_path = tmp_path / "package.json"
+        package_path.write_text(json.dumps({"name": "test", "version": "1.0.0-beta.1"}))
+
+        pkg = PackageInfo("Test", tmp_path, package_path)
+        assert pkg.version == "1.0.0-beta.1"
+        with pytest.raises(ValueError):
+            pkg.bump_version(BumpType.PATCH)
+
+    def test_relative_path_outside_project(self, temp_package_json, tmp_path):
+        """Test packages outside the project keep their full path."""
+        pkg = PackageInfo("Test", tmp_path, temp_package_json)
+        assert pkg.relative_path == str(tmp_path)
+
+    @pytest.mark.slow
     def test_update_version(self, temp_package_json, tmp_path):
         """Test updating package.json version."""
         pkg = PackageInfo("Test", tmp_path, temp_package_json)
@@ -77,6 +105,37 @@ class TestPackageInfo:
         with open(temp_package_json, "r") as f:
             data = json.load(f)
         assert data["version"] == "2.0.0"
+        assert not temp_package_json.with_suffix(".json.tmp").exists()
+
+    @pytest.mark.slow
+    def test_update_version_without_orjson(self, temp_package_json, tmp_path):
+        """Test the stdlib json fallback writes the same layout."""
+        pkg = PackageInfo("Test", tmp_path, temp_package_json)
+        with patch("publish.orjson", None):
+            pkg.update_version("2.0.0", dry_run=False)
+
+        text = temp_package_json.read_text()
+        assert text == json.dumps(pkg._data, indent=2, ensure_ascii=False) + "\n"
+
+    @pytest.mark.slow
+    def test_reload_after_external_edit(self, temp_package_json, tmp_path):
+        """Test a changed package.json is read again instead of served from cache."""
+        PackageInfo("Test", tmp_path, temp_package_json)
+        before = temp_package_json.stat()
+        data = json.loads(temp_package_json.read_text())
+        data["version"] = "9.9.10"
+        temp_package_json.write_text(json.dumps(data))
+        # Same mtime tick: only the size tells the edit apart
+        os.utime(temp_package_json, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+        assert PackageInfo("Test", tmp_path, temp_package_json).version == "9.9.10"
+
+    @pytest.mark.slow
+    def test_bump_version_after_update(self, temp_package_json, tmp_path):
+        """Test bumping starts from the updated version."""
+        pkg = PackageInfo("Test", tmp_path, temp_package_json)
+        pkg.update_version("2.0.0", dry_run=False)
+        assert pkg.bump_version(BumpType.PATCH) == "2.0.1"
 
     def test_update_version_dry_run(self, temp_package_json, tmp_path):
         """Test dry run doesn't modify package.json."""
@@ -89,6 +148,17 @@ class TestPackageInfo:
         assert data["version"] == "1.2.3"
 
 
+@pytest.fixture(scope="session")
+def version_package_jsons(tmp_path_factory):
+    """Write one read-only package.json per version used by the bump tests."""
+    paths = {}
+    for version in ("0.1.0", "1.2.3", "10.20.30"):
+        package_path = tmp_path_factory.mktemp("pkg") / "package.json"
+        package_path.write_text(json.dumps({"name": "test", "version": version}))
+        paths[version] = package_path
+    return paths
+
+
 class TestVersionBumping:
     """Test version bumping logic."""
 
@@ -103,14 +173,10 @@ class TestVersionBumping:
         ("10.20.30", BumpType.MINOR, "10.21.0"),
         ("10.20.30", BumpType.MAJOR, "11.0.0"),
     ])
-    def test_version_bumping(self, current, bump, expected, tmp_path):
+    def test_version_bumping(self, current, bump, expected, version_package_jsons):
         """Test various version bumping scenarios."""
-        package_data = {"name": "test", "version": current}
-        package_path = tmp_path / "package.json"
-        with open(package_path, "w") as f:
-            json.dump(package_data, f)
-
-        pkg = PackageInfo("Test", tmp_path, package_path)
+        package_path = version_package_jsons[current]
+        pkg = PackageInfo("Test", package_path.parent, package_path)
         assert pkg.bump_version(bump) == expected
 
 
@@ -136,10 +202,30 @@ class TestGitOperations:
         # Should return True and continue (with warning)
         assert check_git_clean() is True
 
+    @patch('subprocess.run')
+    def test_git_commands_skip_hooks(self, mock_run, monkeypatch):
+        """Test git runs with hook managers disabled."""
+        monkeypatch.delenv("PUBLISH_GIT_HOOKS", raising=False)
+        _git_env.cache_clear()
+        mock_run.return_value = Mock(stdout="", returncode=0)
+        try:
+            check_git_clean()
+        finally:
+            _git_env.cache_clear()
+        env = mock_run.call_args.kwargs["env"]
+        assert env["HUSKY"] == "0"
+        assert env["LEFTHOOK"] == "0"
+
 
 class TestNpmOperations:
     """Test npm-related functions."""
 
+    @pytest.fixture(autouse=True)
+    def npm_installed(self):
+        """Pretend npm is on PATH."""
+        with patch("publish.find_executable", return_value="/usr/bin/npm"):
+            yield
+
     @patch('subprocess.run')
     def test_check_npm_credentials_logged_in(self, mock_run):
         """Test npm credentials check when logged in."""
@@ -158,10 +244,25 @@ class TestNpmOperations:
         mock_run.side_effect = FileNotFoundError()
         assert check_npm_credentials() is False
 
+    @patch('subprocess.run')
+    def test_check_npm_credentials_npm_not_on_path(self, mock_run):
+        """Test npm is not spawned when it is not on PATH."""
+        with patch("publish.find_executable", return_value=None):
+            assert check_npm_credentials() is False
+        mock_run.assert_not_called()
+
 
 class TestOnePasswordIntegration:
     """Test 1Password OTP integration."""
 
+    @pytest.fixture(autouse=True)
+    def op_installed(self, monkeypatch):
+        """Pretend op is on PATH, with no OTP or token from the environment."""
+        monkeypatch.delenv("NPM_OTP", raising=False)
+        monkeypatch.delenv("NPM_TOKEN", raising=False)
+        with patch("publish.find_executable", return_value="/usr/bin/op"):
+            yield
+
     @patch('subprocess.run')
     def test_get_otp_success(self, mock_run):
         """Test successful OTP retrieval from 1Password."""
@@ -183,6 +284,43 @@ class TestOnePasswordIntegration:
         otp = get_otp_from_1password()
         assert otp is None
 
+    @patch('subprocess.run')
+    def test_get_otp_cli_not_on_path(self, mock_run):
+        """Test op is not spawned when it is not on PATH."""
+        with patch("publish.find_executable", return_value=None):
+            assert get_otp_from_1password() is None
+        mock_run.assert_not_called()
+
+    @patch('subprocess.run')
+    def test_get_otp_from_env(self, mock_run, monkeypatch):
+        """Test NPM_OTP is used without calling 1Password."""
+        monkeypatch.setenv("NPM_OTP", "654321")
+        assert get_otp_from_1password() == "654321"
+        mock_run.assert_not_called()
+
+    @patch('subprocess.run')
+    def test_get_otp_skipped_with_token(self, mock_run, monkeypatch):
+        """Test no OTP is fetched when NPM_TOKEN is set."""
+        monkeypatch.setenv("NPM_TOKEN", "npm_abc")
+        assert get_otp_from_1password() is None
+        mock_run.assert_not_called()
+
+
+class TestConfirm:
+    """Test confirmation prompts."""
+
+    def test_confirm_assume_yes(self):
+        """Test --yes answers without prompting."""
+        assert confirm("Proceed?", assume_yes=True) is True
+
+    @pytest.mark.parametrize("value,expected", [("1", True), ("yes", True), ("", False), ("0", False)])
+    def test_confirm_non_interactive(self, value, expected, monkeypatch):
+        """Test PUBLISH_CONFIRM answers when stdin is not a terminal."""
+        monkeypatch.setenv("PUBLISH_CONFIRM", value)
+        with patch("sys.stdin") as stdin:
+            stdin.isatty.return_value = False
+            assert confirm("Proceed?") is expected
+
 
 class TestPublishTargets:
     """Test package target selection."""
@@ -207,6 +345,292 @@ class TestPublishTargets:
         assert "Tauri Plugin" in names
         assert "MCP Server" in names
 
+    def test_get_packages_relative_paths(self):
+        """Test summary paths are relative to the project root."""
+        paths = [pkg.relative_path for pkg in get_packages(PublishTarget.ALL)]
+        assert paths == [".", "mcp-server-ts"]
+
+    def test_get_packages_reuses_instances(self):
+        """Test package.json files are loaded once per package."""
+        plugin = get_packages(PublishTarget.PLUGIN)[0]
+        assert get_packages(PublishTarget.ALL)[0] is plugin
+
+
+class TestDryRun:
+    """Test the dry-run publish path."""
+
+    def test_dry_run_skips_preflight_checks(self):
+        """Test dry runs never touch git, npm credentials or 1Password."""
+        with patch("publish.check_git_clean") as git_clean, \
+                patch("publish.check_npm_credentials") as npm_credentials, \
+                patch("publish.get_otp_from_1password") as get_otp, \
+                patch("publish._process_package"):
+            _publish(PublishTarget.ALL, None, dry_run=True, skip_build=True)
+
+        git_clean.assert_not_called()
+        npm_credentials.assert_not_called()
+        get_otp.assert_not_called()
+
+
+class TestPublishPackage:
+    """Test publishing a single package."""
+
+    def test_otp_publishes_run_one_at_a_time(self):
+        """Test publishes sharing an OTP never overlap."""
+        running = 0
+        overlapped = False
+        lock = threading.Lock()
+
+        def run(*args, **kwargs):
+            nonlocal running, overlapped
+            with lock:
+                running += 1
+                overlapped = overlapped or running > 1
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        packages = get_packages(PublishTarget.ALL)
+        with patch("publish.run_command", side_effect=run) as mock_run:
+            with ThreadPoolExecutor(max_workers=len(packages)) as executor:
+                for future in [executor.submit(publish_package, pkg, "123456") for pkg in packages]:
+                    future.result()
+
+        assert mock_run.call_count == len(packages)
+        assert all("--otp" in call.args[0] for call in mock_run.call_args_list)
+        assert not overlapped
+
+
+class TestPublishFlow:
+    """Test the non-dry-run publish path with subprocesses mocked."""
+
+    @pytest.fixture(autouse=True)
+    def preflight_ok(self):
+        """Pass the git and npm checks and confirm every prompt."""
+        with patch("publish.check_git_clean", return_value=True), \
+                patch("publish.check_npm_credentials", return_value=True), \
+                patch("publish.confirm", return_value=True):
+            yield
+
+    def test_stale_otp_is_refetched(self):
+        """Test an OTP older than OTP_MAX_AGE_SECONDS is replaced before publishing."""
+        fetched_at = time.monotonic() - OTP_MAX_AGE_SECONDS - 1
+        with patch("publish._fetch_otp", return_value=("111111", fetched_at)), \
+                patch("publish.get_otp_from_1password", return_value="222222") as get_otp, \
+                patch("publish._process_package") as process:
+            _publish(PublishTarget.PLUGIN, None, dry_run=False, skip_build=True)
+
+        get_otp.assert_called_once()
+        assert process.call_args.args[1] == "222222"
+
+    def test_fresh_otp_is_reused(self):
+        """Test an OTP fetched within OTP_MAX_AGE_SECONDS is used as is."""
+        with patch("publish._fetch_otp", return_value=("111111", time.monotonic())), \
+                patch("publish.get_otp_from_1password") as get_otp, \
+                patch("publish._process_package") as process:
+            _publish(PublishTarget.PLUGIN, None, dry_run=False, skip_build=True)
+
+        get_otp.assert_not_called()
+        assert process.call_args.args[1] == "111111"
+
+
+    @staticmethod
+    def _fail_in(path, error):
+        """Fake run_command that raises error for commands run in path."""
+        def run(cmd, cwd=None, **kwargs):
+            if cwd == path:
+                raise error
+            return subprocess.CompletedProcess(cmd, 0)
+        return run
+
+    def test_failures_are_aggregated(self, capsys):
+        """Test every failed package is listed and the run exits with 1."""
+        failure = subprocess.CalledProcessError(1, "npm publish")
+        with patch("publish._fetch_otp", return_value=("123456", time.monotonic())), \
+                patch("publish.run_command", side_effect=failure) as mock_run:
+            with pytest.raises(SystemExit) as exc_info:
+                _publish(PublishTarget.ALL, None, dry_run=False, skip_build=True)
+
+        assert exc_info.value.code == 1
+        assert mock_run.call_count == 2
+        out = capsys.readouterr().out
+        assert "Publish failed for: Tauri Plugin, MCP Server" in out
+
+    def test_one_failure_does_not_stop_the_other(self, capsys):
+        """Test the other package is still published when one fails."""
+        failure = subprocess.CalledProcessError(1, "npm publish")
+        run = self._fail_in(PROJECT_ROOT / "mcp-server-ts", failure)
+        with patch("publish._fetch_otp", return_value=("123456", time.monotonic())), \
+                patch("publish.run_command", side_effect=run):
+            with pytest.raises(SystemExit) as exc_info:
+                _publish(PublishTarget.ALL, None, dry_run=False, skip_build=True)
+
+        assert exc_info.value.code == 1
+        out = capsys.readouterr().out
+        assert "Successfully published tauri-plugin-mcp@" in out
+        assert "Failed to publish" in out
+        assert "Publish failed for: MCP Server" in out
+        # SystemExit failures were reported where they happened
+        assert "Error processing" not in out
+
+    def test_unexpected_error_is_reported(self, capsys):
+        """Test an exception other than SystemExit is printed with its package."""
+        run = self._fail_in(PROJECT_ROOT, RuntimeError("registry exploded"))
+        with patch("publish._fetch_otp", return_value=("123456", time.monotonic())), \
+                patch("publish.run_command", side_effect=run):
+            with pytest.raises(SystemExit):
+                _publish(PublishTarget.ALL, None, dry_run=False, skip_build=True)
+
+        out = capsys.readouterr().out
+        assert "Error processing Tauri Plugin: registry exploded" in out
+        assert "Publish failed for: Tauri Plugin" in out
+
+    def test_interactive_publish_waits_for_builds(self):
+        """Test publishes that may prompt for an OTP only start after every build."""
+        calls = []
+
+        def run(cmd, cwd=None, **kwargs):
+            # The MCP server takes longer to build than the plugin
+            if cmd[:2] == ["npm", "run"] and cwd != PROJECT_ROOT:
+                time.sleep(0.2)
+            calls.append(cmd[1])
+            return subprocess.CompletedProcess(cmd, 0)
+
+        with patch("publish._fetch_otp", return_value=(None, time.monotonic())), \
+                patch("publish.run_command", side_effect=run):
+            _publish(PublishTarget.ALL, None, dry_run=False, skip_build=False,
+                     speculative_build=False)
+
+        assert calls == ["run", "run", "publish", "publish"]
+
+    def test_parallelism_is_bounded(self):
+        """Test no more than MAX_PARALLEL_PACKAGES packages are processed at once."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+        # Only passes once MAX_PARALLEL_PACKAGES packages are in flight together
+        barrier = threading.Barrier(MAX_PARALLEL_PACKAGES, timeout=5)
+
+        def process(*args):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            barrier.wait()
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        packages = [MagicMock() for _ in range(MAX_PARALLEL_PACKAGES * 2)]
+        with patch("publish.get_packages", return_value=packages), \
+                patch("publish.display_publish_summary"), \
+                patch("publish._fetch_otp", return_value=("123456", time.monotonic())), \
+                patch("publish._process_package", side_effect=process) as mock_process:
+            _publish(PublishTarget.ALL, None, dry_run=False, skip_build=True)
+
+        assert mock_process.call_count == len(packages)
+        assert peak == MAX_PARALLEL_PACKAGES
+
+
+class TestSpeculativeBuild:
+    """Test builds started before the user confirms the publish."""
+
+    @pytest.fixture(autouse=True)
+    def preflight_ok(self):
+        """Pass the preflight checks, with npm found and nothing really run."""
+        with patch("publish.check_git_clean", return_value=True), \
+                patch("publish.check_npm_credentials", return_value=True), \
+                patch("publish.confirm", return_value=True), \
+                patch("publish._fetch_otp", return_value=("123456", time.monotonic())), \
+                patch("publish.resolve_executable", return_value="npm"):
+            yield
+
+    @staticmethod
+    def _builds(*returncodes):
+        """Fake Popen for builds that exit with the given codes."""
+        processes = [Mock(pid=1000 + i, **{"wait.return_value": code})
+                     for i, code in enumerate(returncodes)]
+        return patch("publish.subprocess.Popen", side_effect=processes)
+
+    @staticmethod
+    def _build_calls(mock_run):
+        return [call for call in mock_run.call_args_list
+                if call.args[0] == ["npm", "run", "build"]]
+
+    def test_successful_build_is_reused(self):
+        """Test packages built in the background are not built again."""
+        with self._builds(0, 0) as popen, patch("publish.run_command") as mock_run:
+            _publish(PublishTarget.ALL, None, dry_run=False, skip_build=False)
+
+        assert popen.call_count == 2
+        assert self._build_calls(mock_run) == []
+
+    def test_failed_build_is_rerun(self):
+        """Test a failed background build is run again in the foreground."""
+        with self._builds(1, 1), patch("publish.run_command") as mock_run:
+            _publish(PublishTarget.ALL, None, dry_run=False, skip_build=False)
+
+        assert len(self._build_calls(mock_run)) == 2
+
+    def test_disabled(self):
+        """Test --no-speculative-build only builds in the foreground."""
+        with self._builds() as popen, patch("publish.run_command") as mock_run:
+            _publish(PublishTarget.ALL, None, dry_run=False, skip_build=False,
+                     speculative_build=False)
+
+        popen.assert_not_called()
+        assert len(self._build_calls(mock_run)) == 2
+
+    @pytest.fixture
+    def running_builds(self):
+        """Builds that run until stopped; yields (started, stop_process_tree)."""
+        started = threading.Semaphore(0)
+        stopped = threading.Event()
+
+        def popen(*args, **kwargs):
+            started.release()
+            process = Mock(pid=1000)
+            process.wait.side_effect = lambda: -15 if stopped.wait(5) else 0
+            return process
+
+        with patch("publish.subprocess.Popen", side_effect=popen), \
+                patch("publish._stop_process_tree",
+                      side_effect=lambda process: stopped.set()) as stop:
+            yield started, stop
+
+    def test_cancelled_when_user_declines(self, running_builds):
+        """Test background builds are stopped when the publish is declined."""
+        started, stop = running_builds
+
+        def decline(*args):
+            assert started.acquire(timeout=5)
+            return False
+
+        with patch("publish.confirm", side_effect=decline), \
+                patch("publish.run_command") as mock_run:
+            with pytest.raises(SystemExit) as exc_info:
+                _publish(PublishTarget.PLUGIN, None, dry_run=False, skip_build=False)
+
+        assert exc_info.value.code == 0
+        stop.assert_called()
+        mock_run.assert_not_called()
+
+    def test_cancelled_when_npm_whoami_fails(self, running_builds):
+        """Test background builds are stopped when npm credentials are missing."""
+        started, stop = running_builds
+
+        def logged_out():
+            assert started.acquire(timeout=5)
+            return False
+
+        with patch("publish.check_npm_credentials", side_effect=logged_out), \
+                patch("publish.run_command") as mock_run:
+            with pytest.raises(SystemExit) as exc_info:
+                _publish(PublishTarget.PLUGIN, None, dry_run=False, skip_build=False)
+
+        assert exc_info.value.code == 1
+        stop.assert_called()
+        mock_run.assert_not_called()
 
 class TestEnums:
     """Test enum types."""